@@ -0,0 +1,73 @@
+class BlitManager:
+    def __init__(self, canvas, animated_artists=(), region=None):
+        """
+        Repaint a set of animated artists over a cached figure background
+        
+        Adapted from the Matplotlib blitting tutorial. Static content is
+        rendered by a normal canvas draw; the background is captured on every
+        draw event, and update() only restores it and redraws the animated
+        artists. Only the region holding the animated artists is saved and
+        pushed to the screen.
+        
+        Args:
+            canvas (FigureCanvasAgg): Canvas to draw on (e.g. FigureCanvasTkAgg)
+            animated_artists (iterable): Artists to manage
+            region (callable): Returns the display-space Bbox covering every
+                animated artist; evaluated on every draw, defaults to the
+                whole figure
+        """
+        self.canvas = canvas
+        self._region = region
+        self._bbox = None  # Region saved in _bg and blitted on update()
+        self._bg = None
+        self._artists = []
+        
+        for artist in animated_artists:
+            self.add_artist(artist)
+        
+        # Grab the background on every full draw (first draw, resize, ...)
+        self.cid = canvas.mpl_connect("draw_event", self.on_draw)
+    
+    def on_draw(self, event):
+        """Callback to register with the 'draw_event'"""
+        if event is not None and event.canvas is not self.canvas:
+            raise RuntimeError("Draw event from a different canvas")
+        if self._region is None:
+            self._bbox = self.canvas.figure.bbox
+        else:
+            self._bbox = self._region()
+        self._bg = self.canvas.copy_from_bbox(self._bbox)
+        self._draw_animated()
+    
+    def add_artist(self, artist):
+        """
+        Add an artist to be managed
+        
+        Args:
+            artist (Artist): Artist of the canvas' figure to repaint on update()
+        """
+        if artist.figure is not self.canvas.figure:
+            raise RuntimeError("Artist does not belong to the canvas' figure")
+        artist.set_animated(True)
+        self._artists.append(artist)
+    
+    def disconnect(self):
+        """Stop listening for draw events"""
+        self.canvas.mpl_disconnect(self.cid)
+    
+    def _draw_animated(self):
+        """Draw all of the animated artists"""
+        figure = self.canvas.figure
+        for artist in self._artists:
+            figure.draw_artist(artist)
+    
+    def update(self):
+        """Update the screen with the animated artists"""
+        if self._bg is None:
+            self.on_draw(None)
+        else:
+            # Restore the background, draw the artists and push the result
+            self.canvas.restore_region(self._bg)
+            self._draw_animated()
+            self.canvas.blit(self._bbox)
+        self.canvas.flush_events()
@@ -1,5 +1,16 @@
+import pickle
 import time
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from lap import lapjv
+except ImportError:  # lap is optional; fall back to SciPy's solver
+    lapjv = None
+
+try:
+    from _pathfind_numba import assignment_costs
+except ImportError:  # Numba is optional; fall back to NumPy broadcasting
+    assignment_costs = None
 
 
 class ComparisonAlgorithms:
@@ -18,13 +29,11 @@ class ComparisonAlgorithms:
             dict: Mapping of vehicle IDs to assigned spot IDs
         """
         assignments = {}
-        available_spots = [spot_id for spot_id, spot in facility.spots.items() 
-                        if not spot.occupied and not spot.reserved]
+        available_spots = facility.iter_free_spots(ordered=True)
         
-        for vehicle in vehicles:
-            if available_spots:
-                spot_id = available_spots.pop(0)
-                assignments[vehicle.id] = spot_id
+        # Pair vehicles with spots in order until either runs out
+        for vehicle, spot_id in zip(vehicles, available_spots):
+            assignments[vehicle.id] = spot_id
                 
         return assignments
         
@@ -48,16 +57,20 @@ class ComparisonAlgorithms:
             floor = 0
             starting_pos = (floor,) + facility.layout["entrances"][0]
             
+        # The facility caches distances per start node, so the whole batch
+        # shares a single traversal
+        start_node = facility._node_id(*starting_pos)
+        
         for vehicle in vehicles:
-            spot_id = facility.find_nearest_available_spot(vehicle, starting_pos)
+            spot_id = facility._nearest_preferred_spot(vehicle, start_node)
             if spot_id:
                 assignments[vehicle.id] = spot_id
                 # Mark spot as unavailable for subsequent assignments
-                facility.spots[spot_id].reserve()
+                facility.reserve_spot(spot_id)
                 
         # Reset spots (unmark reservations made for algorithm)
         for spot_id in assignments.values():
-            facility.spots[spot_id].cancel_reservation()
+            facility.cancel_reservation(spot_id)
             
         return assignments
         
@@ -75,13 +88,11 @@ class ComparisonAlgorithms:
             dict: Mapping of vehicle IDs to assigned spot IDs
         """
         import numpy as np
-        from scipy.optimize import linear_sum_assignment
         
         assignments = {}
         
         # Get available spots
-        available_spots = [spot_id for spot_id, spot in facility.spots.items() 
-                          if not spot.occupied and not spot.reserved]
+        available_spots = list(facility.iter_free_spots(ordered=True))
         
         if not vehicles or not available_spots:
             return assignments
@@ -95,39 +106,43 @@ class ComparisonAlgorithms:
             factor = min(2, len(available_spots) // len(vehicles))
             available_spots = available_spots[:len(vehicles) * factor]
             
-        # Create cost matrix
-        cost_matrix = np.zeros((len(vehicles), len(available_spots)))
-        
         if starting_pos is None:
             # Default to first entrance
             floor = 0
             starting_pos = (floor,) + facility.layout["entrances"][0]
             
-        # Fill cost matrix with distances from entrance to each spot
-        for i, vehicle in enumerate(vehicles):
-            for j, spot_id in enumerate(available_spots):
-                spot = facility.spots[spot_id]
-                
-                # Base cost is distance
-                spot_pos = (spot.floor,) + spot.location
-                start_node = f"{starting_pos[0]}-{starting_pos[1]}-{starting_pos[2]}"
-                end_node = f"{spot_pos[0]}-{spot_pos[1]}-{spot_pos[2]}"
-                
-                try:
-                    distance, _ = facility._dijkstra(start_node, end_node)
-                except:
-                    # Fallback if pathfinding fails
-                    distance = abs(starting_pos[1] - spot_pos[1]) + abs(starting_pos[2] - spot_pos[2])
-                
-                # Adjust cost based on vehicle preferences
-                preference_score = facility._compute_spot_preference_score(spot, vehicle)
-                
-                # Final cost is distance minus preference score (for minimization)
-                cost = distance - (preference_score / 5)
-                cost_matrix[i, j] = max(0.1, cost)  # Ensure positive cost
+        spot_idx = facility._spot_indices(available_spots)
+        spot_xy = facility._spot_loc[spot_idx].astype(np.int64)
+        
+        # Distances from the start to every spot, from a single traversal
+        start_node = facility._node_id(*starting_pos)
+        dist_map = np.asarray(facility._dijkstra_all(start_node))
+        dist_vec = dist_map[facility._spot_node[spot_idx]].astype(np.float64)
+        
+        # Fallback to Manhattan distance where pathfinding fails
+        unreachable = dist_vec < 0
+        dist_vec[unreachable] = np.abs(
+            spot_xy[unreachable] - np.array(starting_pos[1:])
+        ).sum(axis=1)
+        
+        if assignment_costs is not None:
+            # Fused preference scoring and cost computation
+            cost_matrix = assignment_costs(
+                spot_idx, facility._spot_type_code, facility._spot_entrance_dist, dist_vec,
+                np.array([vehicle.type for vehicle in vehicles], dtype=np.int8),
+                np.array([bool(vehicle.preferences.get('near_entrance')) for vehicle in vehicles])
+            )
+        else:
+            # Adjust cost based on vehicle preferences
+            pref = np.stack([facility._compute_preferences_vec(vehicle, spot_idx)
+                             for vehicle in vehicles])
+            
+            # Final cost is distance minus preference score (for minimization)
+            cost_matrix = np.maximum(0.1, dist_vec[None, :] - pref / 5.0)  # Ensure positive cost
+            cost_matrix = cost_matrix.astype(np.float32)
                 
         # Solve assignment problem
-        row_ind, col_ind = linear_sum_assignment(cost_matrix)
+        row_ind, col_ind = ComparisonAlgorithms._solve_lap(cost_matrix)
         
         # Create assignments
         for i, j in zip(row_ind, col_ind):
@@ -138,14 +153,46 @@ class ComparisonAlgorithms:
         return assignments
         
     @staticmethod
-    def compare_algorithms(facility, vehicles, algorithms=None):
+    def _solve_lap(cost_matrix):
+        """
+        Solve a rectangular linear assignment problem
+        
+        Uses the LAPJV solver from the lap package when installed, which is
+        considerably faster than SciPy on larger matrices.
+        
+        Args:
+            cost_matrix (ndarray): Cost of assigning row i to column j
+            
+        Returns:
+            tuple: (row_ind, col_ind) arrays of matched rows and columns
+        """
+        if lapjv is None:
+            from scipy.optimize import linear_sum_assignment
+            return linear_sum_assignment(cost_matrix)
+            
+        import numpy as np
+        
+        # extend_cost pads rectangular matrices internally
+        _, x, _ = lapjv(cost_matrix, extend_cost=True)
+        row_ind = np.flatnonzero(x >= 0)
+        return row_ind, x[row_ind]
+        
+    @staticmethod
+    def compare_algorithms(facility, vehicles, algorithms=None, max_workers=1):
         """
         Compare different assignment algorithms
         
+        With max_workers above 1, algorithms are evaluated in parallel worker
+        processes, each working on its own pickled copy of the facility.
+        Algorithms that cannot be pickled (e.g. lambdas) are evaluated in
+        this process instead.
+        
         Args:
             facility (ParkingFacility): The parking facility
             vehicles (list): List of vehicles to assign
             algorithms (list): List of algorithm functions to compare
+            max_workers (int): Worker process limit; the default of 1
+                evaluates everything in this process
             
         Returns:
             dict: Results of algorithm comparison
@@ -157,56 +204,105 @@ class ComparisonAlgorithms:
                 ("Hungarian (Optimal)", ComparisonAlgorithms.hungarian_assignment)
             ]
             
+        parallel = []
+        if max_workers > 1:
+            for name, algorithm in algorithms:
+                try:
+                    pickle.dumps(algorithm)
+                except (pickle.PicklingError, AttributeError, TypeError):
+                    continue
+                parallel.append(name)
+                
         results = {}
+        futures = {}
+        
+        if len(parallel) > 1:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(parallel))) as pool:
+                for name, algorithm in algorithms:
+                    if name in parallel:
+                        futures[name] = pool.submit(
+                            ComparisonAlgorithms._evaluate_algorithm,
+                            facility, vehicles, algorithm
+                        )
+                        
+                # Run the remaining algorithms here while the workers are busy
+                for name, algorithm in algorithms:
+                    if name not in futures:
+                        results[name] = ComparisonAlgorithms._evaluate_algorithm(
+                            facility, vehicles, algorithm
+                        )
+                        
+                for name, future in futures.items():
+                    results[name] = future.result()
+        else:
+            for name, algorithm in algorithms:
+                results[name] = ComparisonAlgorithms._evaluate_algorithm(
+                    facility, vehicles, algorithm
+                )
+                
+        # Keep the order in which the algorithms were given
+        return {name: results[name] for name, _ in algorithms}
+        
+    @staticmethod
+    def _evaluate_algorithm(facility, vehicles, algorithm):
+        """
+        Run one assignment algorithm and measure the quality of its result
         
-        # Deep copy of facility and vehicles to avoid contamination
-        import copy
+        The facility and vehicles are restored to their prior state afterwards.
         
-        for name, algorithm in algorithms:
-            # Clone facility and vehicles
-            facility_copy = copy.deepcopy(facility)
-            vehicles_copy = copy.deepcopy(vehicles)
+        Args:
+            facility (ParkingFacility): The parking facility
+            vehicles (list): List of vehicles to assign
+            algorithm (callable): Assignment algorithm to evaluate
             
+        Returns:
+            dict: Assignment count, average distance and preference, and run time
+        """
+        vehicle_by_id = {vehicle.id: vehicle for vehicle in vehicles}
+        
+        # Default starting position (entrance)
+        floor = 0
+        starting_pos = (floor,) + facility.layout["entrances"][0]
+        start_node = facility._node_id(*starting_pos)
+        dist_map = facility._dijkstra_all(start_node)
+        
+        # Save mutable state so each algorithm sees the same input
+        facility_state = facility.snapshot()
+        vehicle_state = [vehicle.assigned_spot for vehicle in vehicles]
+        
+        try:
             # Measure assignment time
             start_time = time.time()
-            assignments = algorithm(facility_copy, vehicles_copy)
+            assignments = algorithm(facility, vehicles)
             end_time = time.time()
+        finally:
+            facility.restore(facility_state)
+            for vehicle, assigned_spot in zip(vehicles, vehicle_state):
+                vehicle.assigned_spot = assigned_spot
+        
+        # Compute metrics
+        total_distance = 0
+        preference_satisfaction = 0
+        
+        for vehicle_id, spot_id in assignments.items():
+            vehicle = vehicle_by_id[vehicle_id]
+            spot = facility.spots[spot_id]
             
-            # Compute metrics
-            total_distance = 0
-            preference_satisfaction = 0
+            # Calculate distance
+            distance = dist_map[spot.node_id]
+            if distance < 0:
+                # Fallback if pathfinding fails
+                distance = abs(starting_pos[1] - spot.location[0]) + abs(starting_pos[2] - spot.location[1])
             
-            # Default starting position (entrance)
-            floor = 0
-            starting_pos = (floor,) + facility.layout["entrances"][0]
+            total_distance += distance
             
-            for vehicle_id, spot_id in assignments.items():
-                vehicle = next(v for v in vehicles_copy if v.id == vehicle_id)
-                spot = facility_copy.spots[spot_id]
-                
-                # Calculate distance
-                spot_pos = (spot.floor,) + spot.location
-                start_node = f"{starting_pos[0]}-{starting_pos[1]}-{starting_pos[2]}"
-                end_node = f"{spot_pos[0]}-{spot_pos[1]}-{spot_pos[2]}"
-                
-                try:
-                    distance, _ = facility_copy._dijkstra(start_node, end_node)
-                except:
-                    # Fallback if pathfinding fails
-                    distance = abs(starting_pos[1] - spot_pos[1]) + abs(starting_pos[2] - spot_pos[2])
-                
-                total_distance += distance
-                
-                # Calculate preference satisfaction
-                preference_score = facility_copy._compute_spot_preference_score(spot, vehicle)
-                preference_satisfaction += preference_score
-                
-            # Store results
-            results[name] = {
-                "assignments": len(assignments),
-                "avg_distance": total_distance / len(assignments) if assignments else 0,
-                "avg_preference": preference_satisfaction / len(assignments) if assignments else 0,
-                "execution_time": end_time - start_time
-            }
-            
-        return results
+            # Calculate preference satisfaction
+            preference_score = facility._compute_spot_preference_score(spot, vehicle)
+            preference_satisfaction += preference_score
+            
+        return {
+            "assignments": len(assignments),
+            "avg_distance": float(total_distance / len(assignments)) if assignments else 0,
+            "avg_preference": float(preference_satisfaction / len(assignments)) if assignments else 0,
+            "execution_time": end_time - start_time
+        }
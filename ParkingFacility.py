@@ -1,27 +1,55 @@
-import random
-import heapq
 from collections import defaultdict
-from ParkingSpot import ParkingSpot
+import numpy as np
+from scipy.spatial.distance import cdist
+from ParkingSpot import ParkingSpot, SpotType
+from Vehicle import VehicleType
+
+try:
+    from _pathfind_numba import bfs_csr, nearest_preferred_spot, score_spots
+except ImportError:  # Numba is optional; fall back to pure Python/NumPy
+    bfs_csr = nearest_preferred_spot = score_spots = None
 
 
 
 class ParkingFacility:
-    def __init__(self, name, layout=None):
+    def __init__(self, name, layout=None, rng=None):
         """
         Initialize a parking facility
         
         Args:
             name (str): Name of the facility
             layout (dict): Dictionary defining the layout configuration
+            rng (numpy.random.Generator): Generator the spot types are drawn from;
+                a fresh unseeded one if omitted
         """
         self.name = name
         self.spots = {}  # Hash map for O(1) lookup of spots
         self.vehicles = {}  # Hash map for vehicles currently in the facility
+        self.free_spots = set()  # IDs of spots neither occupied nor reserved
+        self.free_by_type = defaultdict(set)  # Free spot IDs bucketed by spot type
+        self.changed_spots = set()  # IDs of spots whose state changed since last pop_changed_spots()
+        self._status_cache = None  # Last get_occupancy_status() result
+        self._status_cache_dirty = True  # Set on any spot state change
+        self._spot_index = {}  # Creation order of each spot, for stable iteration
+        self._spot_ids = []  # Spot IDs in creation order (inverse of _spot_index)
+        self._spot_loc = None  # (x, y) of each spot by creation index
+        self._spot_type_code = None  # SpotType code of each spot by creation index
+        self._spot_node = None  # Navigation graph node of each spot by creation index
+        self._floor_spot_idx = {}  # Creation indices of the spots on each floor
+        self._entrance_arr = None  # (x, y) of each entrance
+        self._spot_entrance_dist = None  # Manhattan distance from each spot to nearest entrance
+        self._spot_occupied = None  # Occupied flag of each spot by creation index
+        self._spot_reserved = None  # Reserved flag of each spot by creation index
+        self._spot_occupied_since = None  # Occupation start of each spot (NaN when free)
         self.occupancy_grid = {}  # Grid representation of occupancy
         self.layout = layout or self._default_layout()
-        self.graph = {}  # Graph representation for pathfinding
+        self._rng = rng if rng is not None else np.random.default_rng()
+        self._graph = None  # CSR adjacency (indptr, indices), built lazily by the graph property
+        self._adjacency = None  # Per-node neighbor lists for pure-Python traversal
+        self._dist_cache = {}  # Memoized shortest-path distances keyed by start node
         self.total_spots = 0
         self.available_spots = 0
+        self.current_time = 0  # Simulation clock in minutes, advanced by the simulator
         self.statistics = {
             "total_vehicles": 0,
             "avg_occupancy_rate": 0,
@@ -59,6 +87,11 @@ class ParkingFacility:
             for floor in range(floors)
         }
         
+        # Cells without a spot; the layout lists are scanned once instead of per cell
+        blocked = set(map(tuple, self.layout["aisles"]))
+        blocked.update(map(tuple, self.layout["entrances"]))
+        blocked.update(map(tuple, self.layout["exits"]))
+        
         # Create spots based on layout
         spot_id = 1
         for floor in range(floors):
@@ -66,9 +99,7 @@ class ParkingFacility:
             for y in range(height):
                 for x in range(width):
                     # Skip aisles
-                    if (x, y) in self.layout["aisles"] or \
-                       (x, y) in self.layout["entrances"] or \
-                       (x, y) in self.layout["exits"]:
+                    if (x, y) in blocked:
                         continue
                     
                     # Determine spot type based on distribution
@@ -79,9 +110,13 @@ class ParkingFacility:
                         f"{floor}-{spot_id}", 
                         (x, y), 
                         spot_type,
-                        floor
+                        floor,
+                        facility=self
                     )
                     
+                    # Cache the navigation graph node for pathfinding lookups
+                    spot.node_id = self._node_id(floor, x, y)
+                    
                     # Add to hash map and grid
                     self.spots[spot.id] = spot
                     self.occupancy_grid[floor][y][x] = spot.id
@@ -91,54 +126,134 @@ class ParkingFacility:
         self.total_spots = len(self.spots)
         self.available_spots = self.total_spots
         
-        # Build the navigation graph
-        self._build_navigation_graph()
+        # Immutable per-spot arrays for vectorized scoring; they depend only on the
+        # layout, so occupancy changes never invalidate them
+        self._spot_ids = list(self.spots)
+        self._spot_index = {spot_id: i for i, spot_id in enumerate(self._spot_ids)}
+        self._spot_loc = np.array(
+            [spot.location for spot in self.spots.values()], dtype=np.int16
+        ).reshape(-1, 2)
+        self._spot_type_code = np.array(
+            [spot.type for spot in self.spots.values()], dtype=np.int8
+        )
+        self._spot_node = np.array(
+            [spot.node_id for spot in self.spots.values()], dtype=np.int64
+        )
+        spot_floor = np.array([spot.floor for spot in self.spots.values()], dtype=np.int16)
+        self._floor_spot_idx = {
+            floor: np.flatnonzero(spot_floor == floor) for floor in range(floors)
+        }
+        self._entrance_arr = np.asarray(self.layout["entrances"], dtype=np.int16).reshape(-1, 2)
+        self._spot_entrance_dist = cdist(
+            self._spot_loc, self._entrance_arr, 'cityblock'
+        ).min(axis=1)
+        for spot, entrance_dist in zip(self.spots.values(), self._spot_entrance_dist.tolist()):
+            spot.entrance_dist = entrance_dist
+        
+        # Every spot starts out free
+        self._rebuild_spot_state()
+        
+        # The navigation graph is built on first use (see the graph property)
+        self._graph = None
+        self._dist_cache = {}
+        
+    def __getstate__(self):
+        """Drop derived navigation data and cached status when pickling; both are rebuilt lazily"""
+        state = self.__dict__.copy()
+        state["_graph"] = None
+        state["_adjacency"] = None
+        state["_dist_cache"] = {}
+        state["_status_cache"] = None
+        state["_status_cache_dirty"] = True
+        return state
         
     def _determine_spot_type(self):
         """
         Determine spot type based on configured distribution
-        Returns a spot type (e.g., 'standard', 'handicap', 'electric')
+        Returns a SpotType (e.g., STANDARD, HANDICAP, ELECTRIC)
         """
-        r = random.random()
+        r = self._rng.random()
         cumulative = 0
         for spot_type, info in self.layout["spot_types"].items():
             cumulative += info["distribution"]
             if r <= cumulative:
-                return spot_type
-        return "standard"  # Default fallback
+                return SpotType.coerce(spot_type)
+        return SpotType.STANDARD  # Default fallback
+        
+    def _node_id(self, floor, x, y):
+        """Map (floor, x, y) grid coordinates to an integer node ID"""
+        width, height = self.layout["dimensions"]
+        return (floor * height + y) * width + x
+        
+    def _node_coords(self, node):
+        """Map an integer node ID back to (floor, x, y) grid coordinates"""
+        width, height = self.layout["dimensions"]
+        rest, x = divmod(node, width)
+        floor, y = divmod(rest, height)
+        return (floor, x, y)
+        
+    @property
+    def graph(self):
+        """Navigation graph as CSR arrays (indptr, indices), built on first access"""
+        self.build_graph()
+        return self._graph
+        
+    def build_graph(self):
+        """Build the navigation graph now if it has not been built yet"""
+        if self._graph is None:
+            self._build_navigation_graph()
         
     def _build_navigation_graph(self):
-        """Build a graph representation for navigation/pathfinding"""
+        """
+        Build a graph representation for navigation/pathfinding
+        
+        The graph is stored in CSR form: the neighbors of node u are
+        indices[indptr[u]:indptr[u+1]], with node IDs from _node_id.
+        """
         width, height = self.layout["dimensions"]
         floors = self.layout["floors"]
+        num_nodes = floors * height * width
         
-        # Initialize graph
-        self.graph = {}
+        # Drop distances computed on any previous graph
+        self._dist_cache = {}
         
-        # Add nodes for all possible positions (including aisles)
-        for floor in range(floors):
-            for y in range(height):
-                for x in range(width):
-                    node_id = f"{floor}-{x}-{y}"
-                    self.graph[node_id] = []
-                    
-                    # Add edges to adjacent nodes (4-way connectivity)
-                    directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # right, down, left, up
-                    for dx, dy in directions:
-                        nx, ny = x + dx, y + dy
-                        if 0 <= nx < width and 0 <= ny < height:
-                            # Check if it's a valid move (e.g., not through walls)
-                            self.graph[node_id].append(f"{floor}-{nx}-{ny}")
-        
-        # Add connections between floors (elevators/stairs)
+        plane = width * height
+        node = np.arange(num_nodes)
+        x = node % width
+        y = (node // width) % height
+        floor = node // plane
+        
+        # Connections between floors (elevators/stairs)
         # For simplicity, we assume elevators at entrances connect floors
-        for floor in range(floors - 1):
-            for entrance in self.layout["entrances"]:
-                x, y = entrance
-                node_id1 = f"{floor}-{x}-{y}"
-                node_id2 = f"{floor+1}-{x}-{y}"
-                self.graph[node_id1].append(node_id2)
-                self.graph[node_id2].append(node_id1)
+        is_entrance = np.zeros((height, width), dtype=bool)
+        for ex, ey in self.layout["entrances"]:
+            is_entrance[ey, ex] = True
+        has_elevator = is_entrance[y, x]
+        
+        # Candidate neighbors of every node, one column per direction, in the
+        # order right, down, left, up (4-way connectivity), then floor below/above
+        candidates = np.stack([
+            node + width, node + 1, node - width, node - 1,
+            node - plane, node + plane
+        ], axis=1)
+        valid = np.stack([
+            y + 1 < height, x + 1 < width, y - 1 >= 0, x - 1 >= 0,
+            has_elevator & (floor > 0), has_elevator & (floor < floors - 1)
+        ], axis=1)
+        
+        # Row-major selection keeps each node's neighbors contiguous and ordered
+        indices = candidates[valid].astype(np.int32)
+        indptr = np.zeros(num_nodes + 1, dtype=np.int32)
+        np.cumsum(valid.sum(axis=1), out=indptr[1:])
+                        
+        self._graph = (indptr, indices)
+        
+        # Plain lists are much faster than NumPy scalars for Python-level loops
+        if bfs_csr is None:
+            indptr_list, indices_list = indptr.tolist(), indices.tolist()
+            self._adjacency = [
+                indices_list[indptr_list[u]:indptr_list[u + 1]] for u in range(num_nodes)
+            ]
                 
     def find_nearest_available_spot(self, vehicle, location=None):
         """
@@ -161,42 +276,101 @@ class ParkingFacility:
         else:
             floor, x, y = location
             
-        start_node = f"{floor}-{x}-{y}"
+        return self._nearest_preferred_spot(vehicle, self._node_id(floor, x, y))
+        
+    def _nearest_preferred_spot(self, vehicle, start_node):
+        """
+        Pick the nearest of the top 5 preferred free spots for a vehicle
         
+        Args:
+            vehicle (Vehicle): Vehicle looking for parking
+            start_node (int): Node the vehicle starts from
+            
+        Returns:
+            str: ID of the chosen spot, or None if none available
+        """
         # Check for vehicle type compatibility with spots
-        compatible_spots = []
-        for spot_id, spot in self.spots.items():
-            if not spot.occupied and not spot.reserved:
-                # Apply vehicle preferences
-                score = self._compute_spot_preference_score(spot, vehicle)
-                compatible_spots.append((spot_id, score))
-        
-        if not compatible_spots:
+        if not self.free_spots:
             return None
             
-        # Sort spots by preference score (higher is better)
-        compatible_spots.sort(key=lambda x: x[1], reverse=True)
+        if nearest_preferred_spot is not None:
+            # Scoring, top-5 selection and the distance check in one compiled pass
+            best = nearest_preferred_spot(
+                self._spot_occupied, self._spot_reserved, self._spot_type_code,
+                self._spot_entrance_dist, self._spot_node, self._dijkstra_all(start_node),
+                int(vehicle.type), bool(vehicle.preferences.get('near_entrance')), 5
+            )
+            return self._spot_ids[best] if best >= 0 else None
+            
+        spot_idx = self._free_spot_indices()
+        
+        # Apply vehicle preferences
+        scores = self._compute_preferences_vec(vehicle, spot_idx)
         
         # Take top 5 preferred spots and find the nearest one
-        top_spots = compatible_spots[:5]
+        top_spots = [self._spot_ids[i] for i in self._top_k_spots(spot_idx, scores, 5)]
+        
+        # A lone candidate wins without consulting distances
+        if len(top_spots) == 1:
+            return top_spots[0]
+            
+        # Distances to every node from this start, shared across calls
+        dist_map = self._dijkstra_all(start_node)
         
-        # Find shortest path to each of the top spots
         best_spot = None
         shortest_distance = float('inf')
         
-        for spot_id, _ in top_spots:
+        for spot_id in top_spots:
             spot = self.spots[spot_id]
-            spot_node = f"{spot.floor}-{spot.location[0]}-{spot.location[1]}"
+            distance = dist_map[spot.node_id]
             
-            # Find shortest path using Dijkstra's
-            distance, _ = self._dijkstra(start_node, spot_node)
-            
-            if distance < shortest_distance:
+            if 0 <= distance < shortest_distance:
                 shortest_distance = distance
                 best_spot = spot_id
                 
         return best_spot
         
+    def _free_spot_indices(self):
+        """Creation indices of the spots that are neither occupied nor reserved, in order"""
+        return np.flatnonzero(~(self._spot_occupied | self._spot_reserved))
+        
+    def _spot_indices(self, spot_ids):
+        """Map spot IDs to an array of their creation indices"""
+        return np.fromiter((self._spot_index[spot_id] for spot_id in spot_ids),
+                           dtype=np.int64, count=len(spot_ids))
+        
+    def _top_k_spots(self, spot_idx, scores, k):
+        """
+        Select the k best-scoring spots without sorting every candidate
+        
+        Uses np.argpartition so the selection is O(N). Ties are broken by
+        spot creation order, matching a stable sort over self.spots.
+        
+        Args:
+            spot_idx (ndarray): Creation indices of the candidate spots
+            scores (ndarray): Preference score of each candidate (higher is better)
+            k (int): Number of spots to select
+            
+        Returns:
+            ndarray: Creation indices of up to k spots, best first
+        """
+        if len(spot_idx) <= k:
+            top = np.arange(len(spot_idx))
+        else:
+            # Score of the k-th best candidate
+            kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+            above = np.flatnonzero(scores > kth)
+            tied = np.flatnonzero(scores == kth)
+            
+            # Fill the remaining slots with the earliest-created tied spots
+            needed = k - len(above)
+            if len(tied) > needed:
+                tied = tied[np.argpartition(spot_idx[tied], needed - 1)[:needed]]
+            top = np.concatenate([above, tied])
+            
+        top = top[np.lexsort((spot_idx[top], -scores[top]))]
+        return spot_idx[top]
+        
     def _compute_spot_preference_score(self, spot, vehicle):
         """
         Compute a preference score for a spot based on vehicle preferences
@@ -206,76 +380,145 @@ class ParkingFacility:
         
         # Apply preferences if they exist
         if 'near_entrance' in vehicle.preferences and vehicle.preferences['near_entrance']:
-            # Calculate distance to nearest entrance
-            entrance_dist = min(
-                self._manhattan_distance(spot.location, entrance)
-                for entrance in self.layout["entrances"]
-            )
             # Closer to entrance = higher score
-            score += max(0, 5 - entrance_dist)
+            score += max(0, 5 - spot.entrance_dist)
             
         # Prefer spots matching vehicle type
-        if vehicle.type == "handicap" and spot.type == "handicap":
+        if vehicle.type == VehicleType.HANDICAP and spot.type == SpotType.HANDICAP:
             score += 20
-        elif vehicle.type == "electric" and spot.type == "electric":
+        elif vehicle.type == VehicleType.ELECTRIC and spot.type == SpotType.ELECTRIC:
             score += 15
-        elif spot.type == "standard":
+        elif spot.type == SpotType.STANDARD:
             score += 5
             
         return score
         
+    def _compute_preferences_vec(self, vehicle, spot_idx):
+        """
+        Vectorized _compute_spot_preference_score over many spots
+        
+        Args:
+            vehicle (Vehicle): Vehicle whose preferences apply
+            spot_idx (ndarray): Creation indices of the spots to score
+            
+        Returns:
+            ndarray: Preference score of each spot (higher is better)
+        """
+        want_near_entrance = bool(vehicle.preferences.get('near_entrance'))
+        if score_spots is not None:
+            return score_spots(spot_idx, self._spot_type_code, self._spot_entrance_dist,
+                               int(vehicle.type), want_near_entrance)
+            
+        scores = np.full(len(spot_idx), 10.0)  # Base score
+        
+        # Apply preferences if they exist
+        if want_near_entrance:
+            # Closer to entrance = higher score
+            scores += np.maximum(0, 5 - self._spot_entrance_dist[spot_idx])
+            
+        # Prefer spots matching vehicle type
+        type_code = self._spot_type_code[spot_idx]
+        scores += np.where(type_code == SpotType.STANDARD, 5, 0)
+        if vehicle.type == VehicleType.HANDICAP:
+            scores[type_code == SpotType.HANDICAP] += 20
+        elif vehicle.type == VehicleType.ELECTRIC:
+            scores[type_code == SpotType.ELECTRIC] += 15
+            
+        return scores
+        
     def _manhattan_distance(self, pos1, pos2):
         """Calculate Manhattan distance between two positions"""
         return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
         
-    def _dijkstra(self, start, target):
+    def _bfs(self, start, target=None):
         """
-        Implementation of Dijkstra's algorithm for shortest path
+        Breadth-first search from a start node
+        
+        All edges have uniform weight 1, so BFS yields the same shortest
+        distances as Dijkstra without the priority queue overhead.
         
         Args:
-            start (str): Starting node ID
-            target (str): Target node ID
+            start (int): Starting node ID
+            target (int): Optional node ID at which to stop early
             
         Returns:
-            tuple: (distance, path) where path is a list of nodes
+            tuple: (distances, previous) sequences indexed by node ID, holding
+                -1 for nodes that were not reached
         """
-        # Initialize distances and priority queue
-        distances = {node: float('inf') for node in self.graph}
-        distances[start] = 0
-        pq = [(0, start)]
-        previous = {node: None for node in self.graph}
+        indptr, indices = self.graph
+        if bfs_csr is not None:
+            return bfs_csr(indptr, indices, start, -1 if target is None else target,
+                           len(indptr) - 1)
+            
+        adjacency = self._adjacency
+        dist = [-1] * len(adjacency)
+        prev = [-1] * len(adjacency)
+        dist[start] = 0
         
-        while pq:
-            current_distance, current_node = heapq.heappop(pq)
+        # With unit weights the queue only ever holds two distance levels,
+        # so expand one whole frontier at a time instead of using a deque
+        current = [start]
+        distance = 0
+        
+        while current:
+            distance += 1
+            next_level = []
             
-            # If we've reached the target
-            if current_node == target:
-                break
-                
-            # If we've found a worse path
-            if current_distance > distances[current_node]:
-                continue
-                
-            # Check all neighbors
-            for neighbor in self.graph[current_node]:
-                # Assume uniform edge weights of 1 for simplicity
-                distance = current_distance + 1
+            for node in current:
+                for neighbor in adjacency[node]:
+                    if dist[neighbor] >= 0:
+                        continue
+                    dist[neighbor] = distance
+                    prev[neighbor] = node
+                    if neighbor == target:
+                        return dist, prev
+                    next_level.append(neighbor)
+                    
+            current = next_level
                 
-                # If we've found a better path
-                if distance < distances[neighbor]:
-                    distances[neighbor] = distance
-                    previous[neighbor] = current_node
-                    heapq.heappush(pq, (distance, neighbor))
+        return dist, prev
+        
+    def _dijkstra(self, start, target):
+        """
+        Shortest path between two nodes
+        
+        Args:
+            start (int): Starting node ID
+            target (int): Target node ID
+            
+        Returns:
+            tuple: (distance, path) where path is a list of nodes
+        """
+        dist, prev = self._bfs(start, target)
         
         # Reconstruct path
         path = []
         current = target
-        while current:
-            path.append(current)
-            current = previous[current]
+        while current != -1:
+            path.append(int(current))
+            current = prev[current]
         path.reverse()
         
-        return distances[target], path
+        if dist[target] < 0:
+            return float('inf'), path
+        return int(dist[target]), path
+        
+    def _dijkstra_all(self, start):
+        """
+        Shortest distances from a start node to every reachable node
+        
+        Results are memoized per start node; the graph is static after
+        initialization so cached entries stay valid for the whole run.
+        
+        Args:
+            start (int): Starting node ID
+            
+        Returns:
+            list: Shortest distance from start indexed by node ID, -1 if unreachable
+        """
+        if start not in self._dist_cache:
+            self._dist_cache[start], _ = self._bfs(start)
+        return self._dist_cache[start]
         
     def assign_vehicle_to_spot(self, vehicle, spot_id=None):
         """
@@ -309,6 +552,143 @@ class ParkingFacility:
             
         return False
         
+    def snapshot(self):
+        """
+        Capture the mutable occupancy state of the facility
+        
+        Only per-spot state and counters are saved; the layout and the
+        navigation graph never change after initialization.
+        
+        Returns:
+            dict: Opaque state to pass back to restore()
+        """
+        return {
+            "spots": {
+                spot_id: (spot.occupied, spot.reserved, spot.vehicle_id,
+                          spot.occupied_since, spot.reserved_until)
+                for spot_id, spot in self.spots.items()
+            },
+            "vehicles": dict(self.vehicles),
+            "available_spots": self.available_spots,
+            "statistics": dict(self.statistics)
+        }
+        
+    def restore(self, snap):
+        """
+        Restore state previously captured with snapshot()
+        
+        Args:
+            snap (dict): State returned by snapshot()
+        """
+        for spot_id, state in snap["spots"].items():
+            spot = self.spots[spot_id]
+            if (spot.occupied, spot.reserved) != state[:2]:
+                self.changed_spots.add(spot_id)
+            (spot.occupied, spot.reserved, spot.vehicle_id,
+             spot.occupied_since, spot.reserved_until) = state
+        self.vehicles = dict(snap["vehicles"])
+        self.available_spots = snap["available_spots"]
+        self.statistics = dict(snap["statistics"])
+        self._status_cache_dirty = True  # The cached status refers to the old statistics dict
+        self._rebuild_spot_state()
+        
+    def iter_free_spots(self, ordered=False):
+        """
+        Iterate over the IDs of spots that are neither occupied nor reserved
+        
+        Args:
+            ordered (bool): Yield spots in creation order rather than set order
+            
+        Returns:
+            iterator: Free spot IDs
+        """
+        if ordered:
+            spot_ids = self._spot_ids
+            return (spot_ids[i] for i in self._free_spot_indices().tolist())
+        return iter(self.free_spots)
+        
+    def _rebuild_spot_state(self):
+        """Recompute the per-spot state arrays and free-spot sets from every spot"""
+        spots = self.spots.values()
+        self._spot_occupied = np.array([spot.occupied for spot in spots], dtype=bool)
+        self._spot_reserved = np.array([spot.reserved for spot in spots], dtype=bool)
+        self._spot_occupied_since = np.array(
+            [np.nan if spot.occupied_since is None else spot.occupied_since for spot in spots],
+            dtype=np.float64
+        )
+        
+        self.free_spots = set()
+        self.free_by_type = defaultdict(set)
+        for i in np.flatnonzero(~(self._spot_occupied | self._spot_reserved)).tolist():
+            self._mark_free(self._spot_ids[i])
+                
+    def _mark_free(self, spot_id):
+        """Record that a spot became free"""
+        self.free_spots.add(spot_id)
+        self.free_by_type[self.spots[spot_id].type].add(spot_id)
+        
+    def _mark_unavailable(self, spot_id):
+        """Record that a spot was occupied or reserved"""
+        self.free_spots.discard(spot_id)
+        self.free_by_type[self.spots[spot_id].type].discard(spot_id)
+        
+    def _on_spot_changed(self, spot):
+        """
+        Keep derived state in sync after a spot was occupied, vacated,
+        reserved or released (called by ParkingSpot)
+        
+        Args:
+            spot (ParkingSpot): The spot that changed
+        """
+        self.changed_spots.add(spot.id)
+        self._status_cache_dirty = True
+        
+        i = self._spot_index[spot.id]
+        self._spot_occupied[i] = spot.occupied
+        self._spot_reserved[i] = spot.reserved
+        self._spot_occupied_since[i] = np.nan if spot.occupied_since is None else spot.occupied_since
+        
+        if spot.occupied or spot.reserved:
+            self._mark_unavailable(spot.id)
+        else:
+            self._mark_free(spot.id)
+            
+    def pop_changed_spots(self):
+        """
+        Take the IDs of spots whose state changed since the previous call
+        
+        Returns:
+            set: Changed spot IDs
+        """
+        changed = self.changed_spots
+        self.changed_spots = set()
+        return changed
+        
+    def reserve_spot(self, spot_id, duration=30):
+        """
+        Reserve a spot for a duration (in minutes)
+        
+        Args:
+            spot_id (str): ID of the spot to reserve
+            duration (float): Reservation length in minutes
+            
+        Returns:
+            bool: True if the reservation was made, False otherwise
+        """
+        return self.spots[spot_id].reserve(duration)
+        
+    def cancel_reservation(self, spot_id):
+        """
+        Cancel the reservation on a spot
+        
+        Args:
+            spot_id (str): ID of the reserved spot
+            
+        Returns:
+            bool: True if a reservation was cancelled, False otherwise
+        """
+        return self.spots[spot_id].cancel_reservation()
+        
     def vacate_spot(self, spot_id):
         """
         Vacate a parking spot
@@ -335,10 +715,10 @@ class ParkingFacility:
         self.available_spots += 1
         
         # Update statistics - assume $2 per hour
-        hours = duration / 3600
+        hours = duration / 60
         self.statistics["revenue"] += hours * 2
         
-        return duration / 60  # Convert to minutes
+        return duration
         
     def get_path_to_spot(self, start_location, spot_id):
         """
@@ -351,24 +731,21 @@ class ParkingFacility:
         Returns:
             list: Sequence of coordinates forming the path
         """
-        floor, x, y = start_location
-        start_node = f"{floor}-{x}-{y}"
+        start_node = self._node_id(*start_location)
         
-        spot = self.spots[spot_id]
-        target_node = f"{spot.floor}-{spot.location[0]}-{spot.location[1]}"
+        target_node = self.spots[spot_id].node_id
         
         _, path = self._dijkstra(start_node, target_node)
         
         # Convert path nodes to coordinates
-        coordinates = []
-        for node in path:
-            parts = node.split('-')
-            coordinates.append((int(parts[0]), int(parts[1]), int(parts[2])))
-            
-        return coordinates
+        return [self._node_coords(node) for node in path]
         
     def get_occupancy_status(self):
-        """Get current occupancy statistics"""
+        """
+        Get current occupancy statistics
+        
+        The result is cached until a spot changes state; treat it as read-only.
+        """
         occupied = self.total_spots - self.available_spots
         occupancy_rate = occupied / self.total_spots if self.total_spots > 0 else 0
         
@@ -377,6 +754,9 @@ class ParkingFacility:
             self.statistics["avg_occupancy_rate"] * 0.95 + occupancy_rate * 0.05
         )
         
+        if not self._status_cache_dirty:
+            return self._status_cache
+            
         status = {
             "total_spots": self.total_spots,
             "occupied_spots": occupied,
@@ -386,11 +766,16 @@ class ParkingFacility:
         }
         
         # Count by spot type
-        status["by_type"] = defaultdict(lambda: {"total": 0, "occupied": 0})
-        for spot in self.spots.values():
-            status["by_type"][spot.type]["total"] += 1
-            if spot.occupied:
-                status["by_type"][spot.type]["occupied"] += 1
-                
+        total_by_type = np.bincount(self._spot_type_code, minlength=len(SpotType))
+        occupied_by_type = np.bincount(self._spot_type_code[self._spot_occupied],
+                                       minlength=len(SpotType))
+        status["by_type"] = {
+            spot_type.label: {"total": int(total_by_type[spot_type]),
+                              "occupied": int(occupied_by_type[spot_type])}
+            for spot_type in SpotType if total_by_type[spot_type] > 0
+        }
+        
+        self._status_cache = status
+        self._status_cache_dirty = False
         return status
 
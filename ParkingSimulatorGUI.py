@@ -1,8 +1,60 @@
-import matplotlib.pyplot as plt
+import threading
+import time
+import numpy as np
+import matplotlib
+matplotlib.use('TkAgg')  # Select the embedding backend before anything imports pyplot
 import tkinter as tk
 from tkinter import ttk, messagebox
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+from matplotlib.transforms import Bbox
+from BlitManager import BlitManager
+from ParkingSpot import SpotType
 from SmartParkingSimulator import SmartParkingSimulator
+from Vehicle import Vehicle, VehicleType
+
+
+_DAYS = ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday")
+
+# Selectable facility layouts, built once at import
+_LAYOUT_CONFIGS = {
+    "Small": {
+        "dimensions": (10, 8),
+        "floors": 1,
+        "spot_types": {
+            "standard": {"count": 40, "distribution": 0.8},
+            "handicap": {"count": 5, "distribution": 0.1},
+            "electric": {"count": 5, "distribution": 0.1}
+        },
+        "entrances": ((0, 4),),
+        "exits": ((9, 4),),
+        "aisles": tuple((x, 4) for x in range(10))
+    },
+    "Multi-Floor": {
+        "dimensions": (15, 12),
+        "floors": 3,
+        "spot_types": {
+            "standard": {"count": 300, "distribution": 0.8},
+            "handicap": {"count": 45, "distribution": 0.12},
+            "electric": {"count": 30, "distribution": 0.08}
+        },
+        "entrances": ((0, 6),),
+        "exits": ((14, 6),),
+        "aisles": tuple((x, y) for x in range(15) for y in (3, 6, 9))
+    },
+    "Large": {
+        "dimensions": (30, 20),
+        "floors": 1,
+        "spot_types": {
+            "standard": {"count": 400, "distribution": 0.75},
+            "handicap": {"count": 60, "distribution": 0.15},
+            "electric": {"count": 40, "distribution": 0.1}
+        },
+        "entrances": ((0, 5), (0, 15)),
+        "exits": ((29, 5), (29, 15)),
+        "aisles": tuple((x, y) for x in range(30) for y in (5, 10, 15))
+    }
+}
 
 
 class ParkingSimulatorGUI:
@@ -14,9 +66,20 @@ class ParkingSimulatorGUI:
         
         self.simulator = SmartParkingSimulator()
         self.simulator.create_facility()
+        threading.Thread(target=self._warm_up_facility, args=(self.simulator.facility,),
+                         daemon=True).start()
         
         self.create_widgets()
-        self.update_interval = 100  # milliseconds
+        self.update_interval = 100  # milliseconds of wall time per simulated minute at speed 1
+        self.step_interval = 10  # milliseconds between simulation steps
+        self.render_interval = 50  # milliseconds between screen refreshes (caps drawing at 20 FPS)
+        self.stats_interval = 200  # milliseconds between statistics and clock refreshes
+        self.max_step_wall = 4 * self.render_interval  # Longest wall time one step may catch up (after stalls)
+        self._tick_job = None
+        self._next_sim = self._next_render = self._next_stats = 0.0  # Due times in ms, see _tick
+        self._last_step = 0.0  # Wall time in ms the simulation was last advanced to
+        self._build_id = 0  # Identifies the latest background facility build
+        self._last_displayed_minute = None  # (day, hour, minute) shown in the time label
         self.is_simulation_running = False
         
     def create_widgets(self):
@@ -35,7 +98,8 @@ class ParkingSimulatorGUI:
         
         ttk.Label(facility_frame, text="Facility Layout:").pack(anchor=tk.W)
         self.layout_var = tk.StringVar(value="Default")
-        layouts = ["Default", "Small", "Multi-Floor", "Large"]
+        self._active_layout = "Default"  # Layout of the current facility
+        layouts = ["Default"] + list(_LAYOUT_CONFIGS)
         layout_menu = ttk.Combobox(facility_frame, textvariable=self.layout_var, values=layouts)
         layout_menu.pack(fill=tk.X, pady=3)
         layout_menu.bind("<<ComboboxSelected>>", self.on_layout_change)
@@ -66,8 +130,7 @@ class ParkingSimulatorGUI:
         
         ttk.Label(day_frame, text="Day:").pack(side=tk.LEFT)
         self.day_var = tk.StringVar(value="Monday")
-        days = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-        day_menu = ttk.Combobox(day_frame, textvariable=self.day_var, values=days, width=10)
+        day_menu = ttk.Combobox(day_frame, textvariable=self.day_var, values=_DAYS, width=10)
         day_menu.pack(side=tk.LEFT, padx=5)
         day_menu.bind("<<ComboboxSelected>>", self.on_day_change)
         
@@ -89,69 +152,28 @@ class ParkingSimulatorGUI:
         duration_scale.pack(fill=tk.X, pady=3)
         duration_scale.bind("<ButtonRelease-1>", self.on_duration_change)
         
+        # Value labels of the percentage sliders, refreshed by _commit_scale_update
+        self._scale_labels = []
+        self._scale_job = None
+        
         # Vehicle type distribution
         vehicle_type_frame = ttk.Frame(driver_frame)
         vehicle_type_frame.pack(fill=tk.X, pady=3)
+        vehicle_type_frame.columnconfigure(1, weight=1)
         
-        ttk.Label(vehicle_type_frame, text="Vehicle Types:").pack(anchor=tk.W)
-        
-        # Standard vehicles
-        std_frame = ttk.Frame(vehicle_type_frame)
-        std_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(std_frame, text="Standard:").pack(side=tk.LEFT)
-        self.std_var = tk.DoubleVar(value=80.0)
-        ttk.Scale(std_frame, from_=0.0, to=100.0, variable=self.std_var, 
-                 orient=tk.HORIZONTAL).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Label(std_frame, textvariable=self.std_var).pack(side=tk.RIGHT, padx=5)
-        
-        # Handicap vehicles
-        handicap_frame = ttk.Frame(vehicle_type_frame)
-        handicap_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(handicap_frame, text="Handicap:").pack(side=tk.LEFT)
-        self.handicap_var = tk.DoubleVar(value=10.0)
-        ttk.Scale(handicap_frame, from_=0.0, to=100.0, variable=self.handicap_var, 
-                 orient=tk.HORIZONTAL).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Label(handicap_frame, textvariable=self.handicap_var).pack(side=tk.RIGHT, padx=5)
-        
-        # Electric vehicles
-        electric_frame = ttk.Frame(vehicle_type_frame)
-        electric_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(electric_frame, text="Electric:").pack(side=tk.LEFT)
-        self.electric_var = tk.DoubleVar(value=10.0)
-        ttk.Scale(electric_frame, from_=0.0, to=100.0, variable=self.electric_var, 
-                 orient=tk.HORIZONTAL).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Label(electric_frame, textvariable=self.electric_var).pack(side=tk.RIGHT, padx=5)
+        ttk.Label(vehicle_type_frame, text="Vehicle Types:").grid(row=0, column=0, columnspan=3, sticky=tk.W)
+        self.std_var = self._add_pct_slider(vehicle_type_frame, 1, "Standard:", 80.0)
+        self.handicap_var = self._add_pct_slider(vehicle_type_frame, 2, "Handicap:", 10.0)
+        self.electric_var = self._add_pct_slider(vehicle_type_frame, 3, "Electric:", 10.0)
         
         # Driver preferences
         pref_frame = ttk.LabelFrame(driver_frame, text="Driver Preferences", padding="5")
         pref_frame.pack(fill=tk.X, pady=3)
+        pref_frame.columnconfigure(1, weight=1)
         
-        # Near entrance preference
-        near_entrance_frame = ttk.Frame(pref_frame)
-        near_entrance_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(near_entrance_frame, text="Near Entrance:").pack(side=tk.LEFT)
-        self.near_entrance_var = tk.DoubleVar(value=60.0)
-        ttk.Scale(near_entrance_frame, from_=0.0, to=100.0, variable=self.near_entrance_var, 
-                 orient=tk.HORIZONTAL).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Label(near_entrance_frame, textvariable=self.near_entrance_var).pack(side=tk.RIGHT, padx=5)
-        
-        # Easy exit preference
-        easy_exit_frame = ttk.Frame(pref_frame)
-        easy_exit_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(easy_exit_frame, text="Easy Exit:").pack(side=tk.LEFT)
-        self.easy_exit_var = tk.DoubleVar(value=40.0)
-        ttk.Scale(easy_exit_frame, from_=0.0, to=100.0, variable=self.easy_exit_var, 
-                 orient=tk.HORIZONTAL).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Label(easy_exit_frame, textvariable=self.easy_exit_var).pack(side=tk.RIGHT, padx=5)
-        
-        # Covered spot preference
-        covered_spot_frame = ttk.Frame(pref_frame)
-        covered_spot_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(covered_spot_frame, text="Covered Spot:").pack(side=tk.LEFT)
-        self.covered_spot_var = tk.DoubleVar(value=30.0)
-        ttk.Scale(covered_spot_frame, from_=0.0, to=100.0, variable=self.covered_spot_var, 
-                 orient=tk.HORIZONTAL).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Label(covered_spot_frame, textvariable=self.covered_spot_var).pack(side=tk.RIGHT, padx=5)
+        self.near_entrance_var = self._add_pct_slider(pref_frame, 0, "Near Entrance:", 60.0)
+        self.easy_exit_var = self._add_pct_slider(pref_frame, 1, "Easy Exit:", 40.0)
+        self.covered_spot_var = self._add_pct_slider(pref_frame, 2, "Covered Spot:", 30.0)
         
         # Simulation control buttons
         button_frame = ttk.Frame(left_panel)
@@ -171,24 +193,63 @@ class ParkingSimulatorGUI:
         stats_frame = ttk.LabelFrame(left_panel, text="Statistics", padding="5")
         stats_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        self.stats_text = tk.Text(stats_frame, height=8, width=30, wrap=tk.WORD)
-        self.stats_text.pack(fill=tk.BOTH, expand=True)
-        self.stats_text.configure(state="disabled")
+        # One label per value, so a refresh only touches the values that changed
+        stats_rows = [("total_spots", "Total Spots:"), ("occupied", "Occupied:"),
+                      ("available", "Available:"), ("rate", "Occupancy Rate:"),
+                      (None, "By Vehicle Type:")]
+        stats_rows += [(spot_type.label, f"{spot_type.label.title()}:") for spot_type in SpotType]
+        stats_rows += [("revenue", "Total Revenue:")]
+        
+        self.stats_vars = {}
+        self._prev_stats = {}
+        for row, (key, text) in enumerate(stats_rows):
+            ttk.Label(stats_frame, text=text).grid(row=row, column=0, sticky=tk.W)
+            if key is not None:
+                self.stats_vars[key] = tk.StringVar(value="")
+                ttk.Label(stats_frame, textvariable=self.stats_vars[key]).grid(
+                    row=row, column=1, sticky=tk.W, padx=5)
         
         # Right panel for visualization
         right_panel = ttk.LabelFrame(main_frame, text="Facility Visualization", padding="10")
         right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Matplotlib figure
-        self.fig = plt.Figure(figsize=(6, 4), dpi=100)
+        self.fig = Figure(figsize=(6, 4), dpi=100)
         self.ax = self.fig.add_subplot(111)
         
         self.canvas = FigureCanvasTkAgg(self.fig, master=right_panel)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
+        # Blitting of the spot markers between full redraws
+        self.blit_manager = None
+        self._blit_version = None  # Simulator view version the blit manager was built for
+        self._blit_frame = None  # Simulator frame version last drawn to the canvas
+        
         # Initialize visualization
         self.update_visualization()
         
+    def _add_pct_slider(self, parent, row, label, default):
+        """
+        Add a 0-100 slider row (name, scale, value) to a gridded parent
+        
+        Args:
+            parent (ttk.Frame): Container laid out with grid
+            row (int): Grid row to fill
+            label (str): Name shown left of the slider
+            default (float): Initial slider value
+            
+        Returns:
+            tk.DoubleVar: Variable holding the slider value
+        """
+        var = tk.DoubleVar(value=default)
+        ttk.Label(parent, text=label).grid(row=row, column=0, sticky=tk.W)
+        ttk.Scale(parent, from_=0.0, to=100.0, variable=var, orient=tk.HORIZONTAL,
+                  command=self._on_scale_drag).grid(row=row, column=1, sticky=tk.EW, pady=2)
+        value_label = ttk.Label(parent, text=f"{default:.0f}")
+        value_label.grid(row=row, column=2, sticky=tk.E, padx=5)
+        self._scale_labels.append((var, value_label))
+        return var
+        
     def start_simulation(self):
         """Start the simulation"""
         if not self.is_simulation_running:
@@ -203,8 +264,10 @@ class ParkingSimulatorGUI:
             self.start_button["state"] = "disabled"
             self.stop_button["state"] = "normal"
             
-            # Start update loop
-            self.update_simulation()
+            # Start the update loop; every channel is due immediately
+            self._next_sim = self._next_render = self._next_stats = 0.0
+            self._last_step = time.perf_counter() * 1000 - self.step_interval
+            self._tick()
             
     def stop_simulation(self):
         """Stop the simulation"""
@@ -212,51 +275,179 @@ class ParkingSimulatorGUI:
             self.simulator.stop_simulation()
             self.is_simulation_running = False
             
+            if self._tick_job is not None:
+                self.root.after_cancel(self._tick_job)
+                self._tick_job = None
+            
+            # Show the state reached by the last step
+            self._render()
+            
             # Update UI
             self.start_button["state"] = "normal"
             self.stop_button["state"] = "disabled"
             
     def reset_simulation(self):
-        """Reset the simulation"""
+        """Reset the simulation, building the new facility in a worker thread"""
         self.stop_simulation()
         
         # Recreate facility based on current layout
         layout = self.get_selected_layout()
-        self.simulator = SmartParkingSimulator()
-        self.simulator.create_facility(layout=layout)
+        layout_name = self.layout_var.get()
+        self._build_id += 1
+        result = {}
+        worker = threading.Thread(target=self._build_facility_worker, args=(layout, result),
+                                  daemon=True)
+        worker.start()
+        
+        # Keep the UI responsive while the worker runs
+        self.start_button["state"] = "disabled"
+        self.time_label.config(text="Loading…")
+        self._last_displayed_minute = None
+        self._poll_facility_build(worker, result, self._build_id, layout_name)
+        
+    @staticmethod
+    def _build_facility_worker(layout, result):
+        """
+        Create a simulator and its facility; runs off the Tk thread
+        
+        Args:
+            layout (dict): Layout configuration, or None for the default
+            result (dict): Receives the "simulator", or the "error" raised
+        """
+        try:
+            simulator = SmartParkingSimulator()
+            simulator.create_facility(layout=layout)
+            simulator.facility.build_graph()  # Here rather than on the first arrival
+            ParkingSimulatorGUI._warm_up_facility(simulator.facility)
+            result["simulator"] = simulator
+        except Exception as exc:
+            result["error"] = exc
+            
+    @staticmethod
+    def _warm_up_facility(facility):
+        """
+        Choose a spot for a dummy vehicle; runs off the Tk thread
+        
+        This compiles (or loads from the on-disk cache) the Numba kernels of
+        the spot choice and caches the distances from the entrance, which
+        would otherwise freeze the UI on the first arrival.
+        
+        Args:
+            facility (ParkingFacility): Facility to warm up
+        """
+        facility.find_nearest_available_spot(Vehicle("warm-up", VehicleType.STANDARD, 0, 0))
+        
+    def _poll_facility_build(self, worker, result, build_id, layout_name):
+        """Wait on the Tk thread for a facility build, then install its result"""
+        if worker.is_alive():
+            self.root.after(20, self._poll_facility_build, worker, result, build_id, layout_name)
+            return
+            
+        # A newer reset supersedes this build
+        if build_id != self._build_id:
+            return
+            
+        if "error" in result:
+            messagebox.showerror("Change Layout", f"Could not build the facility: {result['error']}")
+            
+            # Keep showing the previous facility
+            self.layout_var.set(self._active_layout)
+            self.update_time_display()
+        else:
+            self._install_facility(result["simulator"], layout_name)
+        self.start_button["state"] = "normal"
+        
+    def _install_facility(self, simulator, layout_name):
+        """Switch to a newly built simulator and refresh every display"""
+        self.simulator = simulator
+        self._active_layout = layout_name
         
         # Update visualization
+        self._blit_version = None
+        self._blit_frame = None
         self.update_visualization()
         
         # Reset statistics display
         self.update_statistics()
+        self.update_time_display()
         
-    def update_simulation(self):
-        """Update the simulation state and visualization"""
-        if self.is_simulation_running:
+    def _tick(self):
+        """
+        Single update loop for the running simulation
+        
+        Stepping, drawing and the statistics/clock labels each have their own
+        interval; one Tk callback runs whichever of them are due and sleeps
+        until the next one is. Each step advances the simulation by the wall
+        time since the previous one, so slow frames or late timers never slow
+        the simulation down, and an overdue channel is run from an idle
+        callback instead of waiting for the next timer tick.
+        """
+        if not self.is_simulation_running:
+            return
+            
+        now = time.perf_counter() * 1000
+        
+        if now >= self._next_sim:
             # Get simulation speed
             speed = self.speed_var.get()
             
-            # Advance simulation
-            time_step = 1.0 * speed  # minutes
+            # Advance simulation, one minute per update_interval at speed 1; after a
+            # stall (suspend, blocked main thread) skip ahead instead of catching up
+            elapsed = min(now - self._last_step, self.max_step_wall)
+            time_step = speed * elapsed / self.update_interval  # minutes
             self.simulator.step_simulation(time_step)
+            self._last_step = now
+            self._next_sim = now + self.step_interval
             
-            # Update visualization and statistics
+        if now >= self._next_render:
+            # Cheap when neither a spot nor the displayed minute changed
             self.update_visualization()
+            self._next_render = now + self.render_interval
+            
+        if now >= self._next_stats:
             self.update_statistics()
             self.update_time_display()
+            self._next_stats = now + self.stats_interval
             
-            # Schedule next update
-            self.root.after(self.update_interval, self.update_simulation)
+        # Schedule the next update for the earliest due channel
+        next_due = min(self._next_sim, self._next_render, self._next_stats)
+        delay = next_due - time.perf_counter() * 1000
+        if delay > 0:
+            self._tick_job = self.root.after(max(1, int(delay)), self._tick)
+        else:
+            self._tick_job = self.root.after_idle(self._tick)
+        
+    def _render(self):
+        """Bring the plot, statistics and clock up to date with the simulator"""
+        self.update_visualization()
+        self.update_statistics()
+        self.update_time_display()
             
     def update_visualization(self):
         """Update the visualization of the facility"""
         floor = self.floor_var.get()
-        self.fig = self.simulator.visualize_facility(floor)
-        
-        # Update canvas
-        self.canvas.figure = self.fig
-        self.canvas.draw()
+        self.simulator.visualize_facility(floor, ax=self.ax)
+        if self._blit_frame == self.simulator.frame_version:
+            return  # Nothing shown changed
+        self._blit_frame = self.simulator.frame_version
+        
+        if self._blit_version != self.simulator.view_version:
+            # Static content was rebuilt: redraw everything and recapture the background
+            if self.blit_manager is not None:
+                self.blit_manager.disconnect()
+            self.blit_manager = BlitManager(self.canvas, self.simulator.animated_artists(),
+                                            region=self._animated_region)
+            self._blit_version = self.simulator.view_version
+            self.canvas.draw_idle()
+        else:
+            # Only spot colors and the title changed
+            self.blit_manager.update()
+        
+    def _animated_region(self):
+        """Display area of the facility axes plus the strip above it holding the title"""
+        ax_box = self.ax.bbox
+        fig_box = self.fig.bbox
+        return Bbox.from_extents(fig_box.x0, ax_box.y0, fig_box.x1, fig_box.y1)
         
     def update_statistics(self):
         """Update statistics display"""
@@ -265,41 +456,48 @@ class ParkingSimulatorGUI:
             
         stats = self.simulator.facility.get_occupancy_status()
         
-        # Format statistics text
-        stats_str = f"Total Spots: {stats['total_spots']}\n"
-        stats_str += f"Occupied: {stats['occupied_spots']}\n"
-        stats_str += f"Available: {stats['available_spots']}\n"
-        stats_str += f"Occupancy Rate: {stats['occupancy_rate']*100:.1f}%\n\n"
+        # Format statistics values
+        values = {
+            "total_spots": str(stats['total_spots']),
+            "occupied": str(stats['occupied_spots']),
+            "available": str(stats['available_spots']),
+            "rate": f"{stats['occupancy_rate']*100:.1f}%",
+            "revenue": f"${stats['statistics']['revenue']:.2f}"
+        }
         
         # Add vehicle type breakdown
-        stats_str += "By Vehicle Type:\n"
-        for spot_type, counts in stats["by_type"].items():
-            if counts["total"] > 0:
+        for spot_type in SpotType:
+            counts = stats["by_type"].get(spot_type.label)
+            if counts and counts["total"] > 0:
                 occ_rate = counts["occupied"] / counts["total"] * 100
-                stats_str += f"{spot_type.title()}: {counts['occupied']}/{counts['total']} ({occ_rate:.1f}%)\n"
+                values[spot_type.label] = f"{counts['occupied']}/{counts['total']} ({occ_rate:.1f}%)"
+            else:
+                values[spot_type.label] = "-"
                 
-        # Add revenue information
-        stats_str += f"\nTotal Revenue: ${stats['statistics']['revenue']:.2f}"
-        
-        # Update text widget
-        self.stats_text.configure(state="normal")
-        self.stats_text.delete(1.0, tk.END)
-        self.stats_text.insert(tk.END, stats_str)
-        self.stats_text.configure(state="disabled")
+        # Only touch the labels whose text changed
+        for key, value in values.items():
+            if self._prev_stats.get(key) != value:
+                self.stats_vars[key].set(value)
+        self._prev_stats = values
         
     def update_time_display(self):
-        """Update the time display"""
-        # Format time
+        """Update the time display, if the displayed minute changed"""
+        # Skip formatting while the same minute is shown
         hour = int(self.simulator.time_of_day)
         minute = int((self.simulator.time_of_day - hour) * 60)
+        shown = (self.simulator.day_of_week, hour, minute)
+        if shown == self._last_displayed_minute:
+            return
+        self._last_displayed_minute = shown
+        
+        # Format time
         am_pm = "AM" if hour < 12 else "PM"
         display_hour = hour % 12
         if display_hour == 0:
             display_hour = 12
             
         # Get day name
-        days = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-        day_name = days[self.simulator.day_of_week]
+        day_name = _DAYS[self.simulator.day_of_week]
         
         time_str = f"Current Time: {display_hour}:{minute:02d} {am_pm}, {day_name}"
         self.time_label.config(text=time_str)
@@ -325,32 +523,43 @@ class ParkingSimulatorGUI:
             ]
             
         # Update driver preferences
-        self.simulator.driver_preferences = {
-            "near_entrance": self.near_entrance_var.get() / 100.0,
-            "covered_spot": self.covered_spot_var.get() / 100.0,
-            "easy_exit": self.easy_exit_var.get() / 100.0
-        }
+        self.simulator.set_driver_preferences(np.array([
+            self.near_entrance_var.get(),
+            self.covered_spot_var.get(),
+            self.easy_exit_var.get()
+        ]) / 100.0)
         
     def on_layout_change(self, event):
         """Handle layout selection change"""
         # Confirm with user before changing during running simulation
         if self.is_simulation_running:
-            result = messagebox.askquestion("Change Layout", 
-                                          "Changing layout will reset the simulation. Continue?",
-                                          icon='warning')
-            if result == 'no':
+            if not messagebox.askyesno("Change Layout",
+                                       "Changing layout will reset the simulation. Continue?",
+                                       icon='warning'):
                 # Reset combobox to current layout
-                self.layout_var.set(self.simulator.facility.name)
+                self.layout_var.set(self._active_layout)
                 return
                 
         # Reset simulation with new layout
         self.reset_simulation()
         
+    def _on_scale_drag(self, value):
+        """Coalesce slider movement into at most one label refresh per 80 ms"""
+        if self._scale_job is None:
+            self._scale_job = self.root.after(80, self._commit_scale_update)
+            
+    def _commit_scale_update(self):
+        """Show the current value of every percentage slider"""
+        self._scale_job = None
+        for var, label in self._scale_labels:
+            text = f"{var.get():.0f}"
+            if label.cget("text") != text:
+                label.config(text=text)
+                
     def on_day_change(self, event):
         """Handle day selection change"""
-        days = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
         selected_day = self.day_var.get()
-        day_index = days.index(selected_day)
+        day_index = _DAYS.index(selected_day)
         
         # Update simulator day
         current_hour = self.simulator.time_of_day
@@ -372,47 +581,6 @@ class ParkingSimulatorGUI:
             
     def get_selected_layout(self):
         """Get the layout configuration based on selection"""
-        selected = self.layout_var.get()
-        
-        if selected == "Small":
-            return {
-                "dimensions": (10, 8),
-                "floors": 1,
-                "spot_types": {
-                    "standard": {"count": 40, "distribution": 0.8},
-                    "handicap": {"count": 5, "distribution": 0.1},
-                    "electric": {"count": 5, "distribution": 0.1}
-                },
-                "entrances": [(0, 4)],
-                "exits": [(9, 4)],
-                "aisles": [(x, 4) for x in range(10)]
-            }
-        elif selected == "Multi-Floor":
-            return {
-                "dimensions": (15, 12),
-                "floors": 3,
-                "spot_types": {
-                    "standard": {"count": 300, "distribution": 0.8},
-                    "handicap": {"count": 45, "distribution": 0.12},
-                    "electric": {"count": 30, "distribution": 0.08}
-                },
-                "entrances": [(0, 6)],
-                "exits": [(14, 6)],
-                "aisles": [(x, y) for x in range(15) for y in [3, 6, 9]]
-            }
-        elif selected == "Large":
-            return {
-                "dimensions": (30, 20),
-                "floors": 1,
-                "spot_types": {
-                    "standard": {"count": 400, "distribution": 0.75},
-                    "handicap": {"count": 60, "distribution": 0.15},
-                    "electric": {"count": 40, "distribution": 0.1}
-                },
-                "entrances": [(0, 5), (0, 15)],
-                "exits": [(29, 5), (29, 15)],
-                "aisles": [(x, y) for x in range(30) for y in [5, 10, 15]]
-            }
-        else:  # Default
-            return None  # Use default layout from ParkingFacility
+        # Default has no entry and uses the default layout from ParkingFacility
+        return _LAYOUT_CONFIGS.get(self.layout_var.get())
 
@@ -1,21 +1,52 @@
-import time
+from enum import IntEnum
+
+
+class SpotType(IntEnum):
+    """Spot categories, stored as ints so comparisons stay cheap"""
+    STANDARD = 0
+    HANDICAP = 1
+    ELECTRIC = 2
+    
+    @classmethod
+    def coerce(cls, value):
+        """Convert a type name such as 'handicap' (or a member/int) to a SpotType"""
+        if isinstance(value, str):
+            return cls[value.upper()]
+        return cls(value)
+        
+    @property
+    def label(self):
+        """Lowercase name used in layouts and statistics"""
+        return self.name.lower()
+
+
+# Status name indexed by occupied + 2 * reserved; occupation wins over a reservation
+_STATUS = ("available", "occupied", "reserved", "occupied")
 
 
 class ParkingSpot:
-    def __init__(self, spot_id, location, spot_type, floor=0):
+    __slots__ = ('id', 'location', 'type', 'floor', 'facility', 'node_id', 'entrance_dist',
+                 'occupied', 'reserved', 'vehicle_id', 'occupied_since', 'reserved_until')
+    
+    def __init__(self, spot_id, location, spot_type, floor=0, facility=None):
         """
         Initialize a parking spot
         
         Args:
             spot_id (str): Unique identifier for the spot
             location (tuple): (x, y) coordinates in the facility
-            spot_type (str): Type of spot (standard, handicap, electric, etc.)
+            spot_type (SpotType or str): Type of spot (standard, handicap, electric)
             floor (int): Floor level in multi-story facilities
+            facility (ParkingFacility): Facility notified when the spot changes state,
+                and whose simulation clock timestamps it
         """
         self.id = spot_id
         self.location = location
-        self.type = spot_type
+        self.type = SpotType.coerce(spot_type)
         self.floor = floor
+        self.facility = facility
+        self.node_id = None  # Navigation graph node, assigned by the facility
+        self.entrance_dist = None  # Distance to the nearest entrance, assigned by the facility
         self.occupied = False
         self.reserved = False
         self.vehicle_id = None
@@ -28,17 +59,19 @@ class ParkingSpot:
             return False
         self.occupied = True
         self.vehicle_id = vehicle_id
-        self.occupied_since = time.time()
+        self.occupied_since = self._now()
+        self._notify_change()
         return True
         
     def vacate(self):
-        """Vacate the spot"""
+        """Vacate the spot and return how long it was occupied (in minutes)"""
         if not self.occupied:
             return False
         self.occupied = False
         self.vehicle_id = None
-        duration = time.time() - self.occupied_since
+        duration = self._now() - self.occupied_since
         self.occupied_since = None
+        self._notify_change()
         return duration
     
     def reserve(self, duration=30):
@@ -46,7 +79,8 @@ class ParkingSpot:
         if self.occupied or self.reserved:
             return False
         self.reserved = True
-        self.reserved_until = time.time() + (duration * 60)
+        self.reserved_until = self._now() + duration
+        self._notify_change()
         return True
     
     def cancel_reservation(self):
@@ -55,16 +89,23 @@ class ParkingSpot:
             return False
         self.reserved = False
         self.reserved_until = None
+        self._notify_change()
         return True
+        
+    def _now(self):
+        """Current simulation time in minutes (0 for a spot without a facility)"""
+        if self.facility is None:
+            return 0
+        return self.facility.current_time
+        
+    def _notify_change(self):
+        """Tell the owning facility that the occupied/reserved state changed"""
+        if self.facility is not None:
+            self.facility._on_spot_changed(self)
     
     def get_status(self):
         """Get the current status of the spot"""
-        if self.occupied:
-            return "occupied"
-        elif self.reserved:
-            return "reserved"
-        else:
-            return "available"
+        return _STATUS[self.occupied + 2 * self.reserved]
             
     def __repr__(self):
-        return f"Spot {self.id} ({self.type}) - {self.get_status()}"
\ No newline at end of file
+        return f"Spot {self.id} ({self.type.label}) - {self.get_status()}"
\ No newline at end of file
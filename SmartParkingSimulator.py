@@ -1,12 +1,105 @@
-import random
 import heapq
-from matplotlib.colors import LinearSegmentedColormap
+import itertools
+import numpy as np
 import matplotlib.patches as patches
+from matplotlib.collections import PatchCollection
 import matplotlib.pyplot as plt
-from Vehicle import Vehicle
+from matplotlib.colors import to_rgba_array
+from matplotlib.markers import MarkerStyle
+from ParkingSpot import SpotType
+from Vehicle import Vehicle, VehicleType
 from ParkingFacility import ParkingFacility
 
 
+_MINUTES_PER_DAY = 24 * 60
+
+# Event type codes, the third field of an event tuple
+_ARRIVAL = 0
+_DEPARTURE = 1
+_REFILL = 2  # Schedules the next batch of arrivals
+
+# Minutes of arrivals scheduled per batch
+_ARRIVAL_HORIZON = 60
+
+# Arrival rate factor by hour of day (rush hours, etc.); other hours get 0.5
+_TIME_FACTORS = {
+    6: 0.5, 7: 1.0, 8: 2.0, 9: 1.5,  # Morning rush
+    12: 1.2, 13: 1.2,  # Lunch
+    16: 1.5, 17: 2.0, 18: 1.8, 19: 1.0,  # Evening rush
+}
+
+# Days of week (0=Sun, 6=Sat) with weekend arrival rates
+_WEEKEND_DAYS = frozenset({0, 6})
+
+# Clock display of every minute of the day, e.g. "9:05 AM"
+_TIME_STRINGS = tuple(
+    f"{hours % 12 or 12}:{minutes:02d} {'AM' if hours < 12 else 'PM'}"
+    for hours in range(24) for minutes in range(60)
+)
+
+# Driver preferences, in the order of SmartParkingSimulator.driver_pref_weights
+_PREFERENCE_NAMES = ("near_entrance", "covered_spot", "easy_exit")
+
+# Preferences held by a driver, indexed by a bitmask over _PREFERENCE_NAMES
+_PREFERENCE_SETS = tuple(
+    {name: True for bit, name in enumerate(_PREFERENCE_NAMES) if mask >> bit & 1}
+    for mask in range(1 << len(_PREFERENCE_NAMES))
+)
+
+# Random attributes of the vehicles of one arrival batch, one record per vehicle
+_VEHICLE_DTYPE = np.dtype([
+    ('type', np.uint8),  # Index into SmartParkingSimulator.vehicle_types
+    ('duration', np.float64),  # Expected parking duration in minutes
+    ('preferences', np.uint8)  # Bitmask over _PREFERENCE_NAMES
+])
+
+# Marker shape and size of each spot type
+_SPOT_MARKERS = {
+    SpotType.STANDARD: ('o', 80),  # circle
+    SpotType.HANDICAP: ('s', 120),  # square
+    SpotType.ELECTRIC: ('D', 100)  # diamond
+}
+
+# Largest layout area (width * height) whose spots still get number labels;
+# every label is a separate text artist redrawn with the markers
+_MAX_LABELED_AREA = 400
+
+# Marker color of each (spot type, status) pair; status 0 is available,
+# 1 reserved and 2 occupied. Every type currently shares the same colors.
+_SPOT_COLOR_LUT = np.tile(
+    to_rgba_array(['green', 'yellow', 'red']).astype(np.float32), (len(SpotType), 1, 1)
+)
+
+
+def _draw_vehicles(rng, n, type_cdf, avg_duration, pref_weights):
+    """
+    Draw the random attributes of a batch of vehicles at once
+    
+    Args:
+        rng (Generator): NumPy generator to draw from
+        n (int): Number of vehicles
+        type_cdf (ndarray): Cumulative weights of the vehicle types
+        avg_duration (float): Mean parking duration in minutes
+        pref_weights (ndarray): Probability that a driver has each preference
+        
+    Returns:
+        ndarray: n records of _VEHICLE_DTYPE
+    """
+    vehicles = np.empty(n, dtype=_VEHICLE_DTYPE)
+    
+    # Select vehicle types based on distribution
+    vehicles['type'] = np.searchsorted(type_cdf, rng.random(n) * type_cdf[-1], side='right')
+    
+    # Random parking durations (normal distribution around mean), minimum 15 minutes
+    vehicles['duration'] = np.maximum(15, rng.normal(avg_duration, avg_duration / 4, n))
+    
+    # Random preferences, one bit per preference
+    has_pref = rng.random((n, len(pref_weights))) < pref_weights
+    vehicles['preferences'] = has_pref @ (1 << np.arange(len(pref_weights)))
+    
+    return vehicles
+
+
 class SmartParkingSimulator:
     def __init__(self):
         """Initialize the smart parking simulator"""
@@ -14,9 +107,18 @@ class SmartParkingSimulator:
         self.simulation_time = 0  # in minutes
         self.simulation_speed = 1  # multiplier
         self.vehicle_id_counter = 1
-        self.events = []  # Priority queue for events
-        self.vehicle_types = ["standard", "handicap", "electric"]
+        self.events = []  # Priority queue of (time, seq, event type, payload) tuples
+        self._event_seq = itertools.count()  # Breaks time ties in scheduling order
+        self._departures = {}  # Sequence number of the pending departure event of each spot
+        self._clock_set = False  # Clock already started for the current facility
+        self._arrivals_until = 0  # Arrivals before this time are already scheduled
+        self._rng = np.random.default_rng()
+        self._arrival_batch = []  # (type, duration, preferences) of each vehicle of the last batch
+        self._batch_first = 1  # Vehicle number of the first entry of _arrival_batch
+        self.vehicle_types = [VehicleType.STANDARD, VehicleType.HANDICAP, VehicleType.ELECTRIC]
+        self._type_cdf = None  # Cumulative vehicle type weights
         self.vehicle_type_distribution = [0.8, 0.1, 0.1]  # Probabilities
+        self._rate_table = None  # Adjusted arrival rate by [weekend, hour]
         self.arrival_rate = 5  # vehicles per hour
         self.avg_parking_duration = 120  # minutes
         self.is_running = False
@@ -24,20 +126,90 @@ class SmartParkingSimulator:
         self.day_of_week = 1  # Monday default (0=Sun, 6=Sat)
         
         # Default driver preferences - probability a driver has this preference
-        self.driver_preferences = {
-            "near_entrance": 0.6,
-            "covered_spot": 0.3,
-            "easy_exit": 0.4
-        }
+        self.driver_preferences = {}
+        self.driver_pref_weights = None
+        self.set_driver_preferences([0.6, 0.3, 0.4])
         
         # Set up visualization
         self.fig = None
         self.ax = None
+        self._view_floor = None  # Floor whose static view is currently drawn
+        self.view_version = 0  # Incremented whenever the static view is rebuilt
+        self.frame_version = 0  # Incremented whenever anything drawn changes
+        self._view_idx = None  # Creation indices of the spots on the drawn floor
+        self._view_types = None  # SpotType codes of the spots on the drawn floor
+        self._spot_collection = None  # Single collection holding every spot marker on the floor
+        self._spot_labels = []  # Number labels drawn over the spot markers
+        self._legend = None
+        self._title = None
+        self._title_time = None  # Clock text shown in the title
+        
+    def set_seed(self, seed):
+        """
+        Seed the simulator's random number generator for a reproducible run
+        
+        Call this before create_facility(), which draws the spot types from
+        the same generator.
+        
+        Args:
+            seed (int): Seed for the generator every random draw comes from
+        """
+        self._rng = np.random.default_rng(seed)
+        
+    @property
+    def arrival_rate(self):
+        """Base arrival rate in vehicles per hour; changes apply from the next hourly batch"""
+        return self._arrival_rate
+        
+    @arrival_rate.setter
+    def arrival_rate(self, rate):
+        self._arrival_rate = rate
+        self._rebuild_rate_table()
+        
+    @property
+    def vehicle_type_distribution(self):
+        """Relative frequency of each entry of vehicle_types"""
+        return self._vehicle_type_distribution
+        
+    @vehicle_type_distribution.setter
+    def vehicle_type_distribution(self, weights):
+        self._vehicle_type_distribution = weights
+        self._type_cdf = np.cumsum(weights, dtype=np.float64)
+        self._redraw_arrival_batch()
+        
+    @property
+    def avg_parking_duration(self):
+        """Mean parking duration in minutes"""
+        return self._avg_parking_duration
+        
+    @avg_parking_duration.setter
+    def avg_parking_duration(self, minutes):
+        self._avg_parking_duration = minutes
+        self._redraw_arrival_batch()
+        
+    def set_driver_preferences(self, weights):
+        """
+        Set the probability that a driver has each preference
+        
+        Args:
+            weights (sequence): Probabilities for near_entrance, covered_spot
+                and easy_exit, in that order
+        """
+        self.driver_pref_weights = np.asarray(weights, dtype=np.float64)
+        
+        # Keep the named form for callers that read the dict
+        self.driver_preferences = dict(zip(_PREFERENCE_NAMES, self.driver_pref_weights.tolist()))
+        self._redraw_arrival_batch()
         
     def create_facility(self, name=None, layout=None):
         """Create a new parking facility"""
         name = name or "Smart Parking Facility"
-        self.facility = ParkingFacility(name, layout)
+        self.facility = ParkingFacility(name, layout, rng=self._rng)
+        
+        # Departures still queued refer to spots of the previous facility
+        self._departures.clear()
+        self._clock_set = False
+        self._view_floor = None
         
     def start_simulation(self):
         """Start the simulation"""
@@ -45,10 +217,20 @@ class SmartParkingSimulator:
             self.create_facility()
             
         self.is_running = True
-        self.simulation_time = 0
         
-        # Schedule initial vehicle arrivals
-        self._schedule_next_arrival()
+        # A new facility's clock starts at the configured day of week and time
+        # of day; after a stop it resumes, as queued departures are absolute
+        if not self._clock_set:
+            self.simulation_time = (self.day_of_week * 24 + self.time_of_day) * 60
+            self._clock_set = True
+        self.facility.current_time = self.simulation_time
+        
+        # Arrivals are scheduled in batches from the current time on; drop any
+        # left over from a previous run
+        self.events = [event for event in self.events if event[2] == _DEPARTURE]
+        heapq.heapify(self.events)
+        self._arrivals_until = self.simulation_time
+        self._prefill_arrivals()
         
     def stop_simulation(self):
         """Stop the simulation"""
@@ -68,90 +250,139 @@ class SmartParkingSimulator:
         
         # Process all events until target_time
         while self.events and self.events[0][0] <= target_time:
-            event_time, event_type, event_data = heapq.heappop(self.events)
+            event_time, seq, event_type, event_data = heapq.heappop(self.events)
             
             # Update simulation time to event time
             self.simulation_time = event_time
+            self.facility.current_time = event_time
             
             # Process event
-            if event_type == "arrival":
-                self._process_vehicle_arrival(event_data)
-            elif event_type == "departure":
-                self._process_vehicle_departure(event_data)
+            if event_type == _ARRIVAL:
+                self._process_vehicle_arrival(self._generate_random_vehicle(event_time, event_data))
+            elif event_type == _DEPARTURE:
+                # Departures invalidated by create_facility stay queued and are skipped here
+                if self._departures.get(event_data) == seq:
+                    del self._departures[event_data]
+                    self._process_vehicle_departure(event_data)
+            elif event_type == _REFILL:
+                self._prefill_arrivals()
                 
         # Update simulation time to target time
         self.simulation_time = target_time
+        self.facility.current_time = target_time
         
         # Update time of day
-        real_minutes = self.simulation_time % (24 * 60)
+        day, real_minutes = divmod(self.simulation_time, _MINUTES_PER_DAY)
         self.time_of_day = real_minutes / 60
-        self.day_of_week = int(self.simulation_time / (24 * 60)) % 7
-        
-    def _schedule_next_arrival(self):
-        """Schedule the next vehicle arrival based on arrival rate"""
-        # Adjust arrival rate based on time of day and day of week
-        adjusted_rate = self._adjust_arrival_rate()
+        self.day_of_week = int(day) % 7
         
-        # Generate random time until next arrival (exponential distribution)
-        if adjusted_rate > 0:
-            mean_time_between_arrivals = 60 / adjusted_rate  # minutes
-            time_until_next = random.expovariate(1 / mean_time_between_arrivals)
-        else:
-            time_until_next = float('inf')  # No arrivals if rate is 0
-            
-        # Schedule arrival event
-        arrival_time = self.simulation_time + time_until_next
-        vehicle = self._generate_random_vehicle(arrival_time)
-        
-        heapq.heappush(self.events, (arrival_time, "arrival", vehicle))
-        
-    def _adjust_arrival_rate(self):
+    def _prefill_arrivals(self):
         """
-        Adjust arrival rate based on time of day and day of week
-        Returns adjusted vehicles per hour
+        Schedule the vehicle arrivals of the next _ARRIVAL_HORIZON minutes in one batch
+        
+        Arrivals form a Poisson process whose rate only changes on the hour,
+        so each hour (or part of one) gets a Poisson-distributed number of
+        arrivals at uniformly distributed times. The random attributes of the
+        batch's vehicles are drawn here too, but Vehicle objects are only built
+        when their arrival is processed. A refill event at the end of the
+        period schedules the next batch, so a changed arrival rate takes
+        effect within the hour; the vehicle settings redraw the pending
+        attributes as soon as they change (see _redraw_arrival_batch).
         """
-        # Hour of day (0-23)
-        hour = int(self.time_of_day)
+        start = max(self._arrivals_until, self.simulation_time)
+        until = start + _ARRIVAL_HORIZON
+        
+        # Split the period at hour boundaries
+        hours = np.arange(np.floor(start / 60) + 1, np.ceil(until / 60)) * 60
+        edges = np.concatenate(([start], hours, [until]))
+        rates = np.array([self._adjust_arrival_rate(t) for t in edges[:-1].tolist()])
+        spans = np.diff(edges)
+        
+        # Expected arrivals per period are rate (per hour) times its length
+        counts = self._rng.poisson(np.maximum(rates, 0) * spans / 60)
+        n = int(counts.sum())
+        arrival_times = np.repeat(edges[:-1], counts) + np.repeat(spans, counts) * self._rng.random(n)
+        arrival_times.sort()
+        
+        first = self.vehicle_id_counter
+        self.vehicle_id_counter += n
+        
+        # Every arrival of a batch precedes its refill event, so a batch is
+        # used up before the next one replaces it
+        self._arrival_batch = self._draw_arrival_batch(n)
+        self._batch_first = first
+        self.events.extend(zip(arrival_times.tolist(), self._event_seq, itertools.repeat(_ARRIVAL, n),
+                               range(first, first + n)))
+        self.events.append((until, next(self._event_seq), _REFILL, None))
+        heapq.heapify(self.events)
+        self._arrivals_until = until
+        
+    def _draw_arrival_batch(self, n):
+        """Draw the attributes of n arriving vehicles with the current settings"""
+        return _draw_vehicles(
+            self._rng, n, self._type_cdf, self.avg_parking_duration, self.driver_pref_weights
+        ).tolist()
+        
+    def _redraw_arrival_batch(self):
+        """
+        Redraw the attributes of the current batch with the current settings
         
+        Called when the vehicle type mix, parking duration or driver
+        preferences change, so the change applies from the next arrival
+        rather than from the next batch. Entries of vehicles that already
+        arrived are redrawn too but never read again.
+        """
+        if self._arrival_batch:
+            self._arrival_batch = self._draw_arrival_batch(len(self._arrival_batch))
+            
+    def _rebuild_rate_table(self):
+        """Precompute the adjusted arrival rate of every hour on weekdays and weekends"""
         # Time of day factors (rush hours, etc.)
-        time_factors = {
-            6: 0.5, 7: 1.0, 8: 2.0, 9: 1.5,  # Morning rush
-            12: 1.2, 13: 1.2,  # Lunch
-            16: 1.5, 17: 2.0, 18: 1.8, 19: 1.0,  # Evening rush
-        }
-        time_factor = time_factors.get(hour, 0.5)
+        time_factor = np.array([_TIME_FACTORS.get(hour, 0.5) for hour in range(24)])
         
         # Weekend factor (weekends are less busy for work parking)
-        weekend_factor = 0.6 if self.day_of_week in [0, 6] else 1.0
+        weekend_factor = np.array([1.0, 0.6])
         
-        # Compute adjusted rate
-        adjusted_rate = self.arrival_rate * time_factor * weekend_factor
+        self._rate_table = self.arrival_rate * weekend_factor[:, None] * time_factor
         
-        return adjusted_rate
+    def _adjust_arrival_rate(self, sim_time=None):
+        """
+        Adjust arrival rate based on time of day and day of week
         
-    def _generate_random_vehicle(self, arrival_time):
-        """Generate a random vehicle based on configured distributions"""
-        # Generate vehicle ID
-        vehicle_id = f"V{self.vehicle_id_counter}"
-        self.vehicle_id_counter += 1
+        Looks the rate up in the table built by _rebuild_rate_table.
         
-        # Select vehicle type based on distribution
-        vehicle_type = random.choices(self.vehicle_types, self.vehicle_type_distribution)[0]
+        Args:
+            sim_time (float): Simulation time to evaluate the rate at,
+                defaults to the current time of day and day of week
+                
+        Returns:
+            float: Adjusted vehicles per hour
+        """
+        # Hour of day (0-23) and day of week
+        if sim_time is None:
+            hour, day = int(self.time_of_day), self.day_of_week
+        else:
+            day, real_minutes = divmod(sim_time, _MINUTES_PER_DAY)
+            hour, day = int(real_minutes // 60), int(day) % 7
+            
+        return self._rate_table[1 if day in _WEEKEND_DAYS else 0, hour]
         
-        # Generate random parking duration (normal distribution around mean)
-        duration = random.normalvariate(self.avg_parking_duration, self.avg_parking_duration / 4)
-        duration = max(15, duration)  # Minimum 15 minutes
+    def _generate_random_vehicle(self, arrival_time, vehicle_number):
+        """
+        Build an arriving vehicle from the attributes drawn for its batch
         
-        # Create vehicle
-        vehicle = Vehicle(vehicle_id, vehicle_type, arrival_time, duration)
+        Args:
+            arrival_time (float): Time the vehicle arrives
+            vehicle_number (int): Number of the vehicle in the current arrival batch,
+                which its ID is made from
+            
+        Returns:
+            Vehicle: The new vehicle
+        """
+        type_index, duration, preferences = self._arrival_batch[vehicle_number - self._batch_first]
         
-        # Generate random preferences
-        preferences = {}
-        for pref, prob in self.driver_preferences.items():
-            if random.random() < prob:
-                preferences[pref] = True
-                
-        vehicle.set_preferences(preferences)
+        vehicle = Vehicle(f"V{vehicle_number}", self.vehicle_types[type_index], arrival_time, duration)
+        vehicle.set_preferences(dict(_PREFERENCE_SETS[preferences]))
         
         return vehicle
         
@@ -161,36 +392,76 @@ class SmartParkingSimulator:
         if self.facility.assign_vehicle_to_spot(vehicle):
             # Schedule departure event
             departure_time = self.simulation_time + vehicle.expected_duration
-            heapq.heappush(self.events, (departure_time, "departure", vehicle.assigned_spot))
+            seq = next(self._event_seq)
+            self._departures[vehicle.assigned_spot] = seq
+            heapq.heappush(self.events, (departure_time, seq, _DEPARTURE, vehicle.assigned_spot))
         else:
             # Vehicle couldn't find a spot and leaves
             pass
             
-        # Schedule next arrival
-        self._schedule_next_arrival()
-        
     def _process_vehicle_departure(self, spot_id):
         """Process a vehicle departure event"""
         # Vacate the spot
         self.facility.vacate_spot(spot_id)
         
-    def visualize_facility(self, floor=0):
+    def visualize_facility(self, floor=0, ax=None):
         """
         Visualize the current state of the parking facility
         
+        The grid, aisles, entrances, exits and spot markers are drawn once per
+        floor; later calls only recolor spots whose state changed and refresh
+        the title, and return at once if neither the spots nor the displayed
+        minute changed.
+        
         Args:
             floor (int): Floor to visualize
+            ax (Axes): Axes to draw on, e.g. one embedded in a GUI; a new
+                figure is created when neither this nor a previous axes is given
         """
         if not self.facility:
             return
             
-        width, height = self.facility.layout["dimensions"]
-        
-        if self.fig is None or self.ax is None:
+        if ax is not None and ax is not self.ax:
+            self.fig, self.ax = ax.figure, ax
+            self._view_floor = None
+        elif self.fig is None or self.ax is None:
             self.fig, self.ax = plt.subplots(figsize=(12, 8))
             
+        changed = self.facility.pop_changed_spots()
+        time_text = self._format_time()
+        
+        if floor != self._view_floor:
+            self._draw_static_view(floor)
+        elif changed:
+            self._spot_collection.set_facecolors(self._spot_colors())
+        elif time_text == self._title_time:
+            # Nothing shown has changed since the last call
+            return self.fig
+            
+        # Add title
+        occupancy = self.facility.get_occupancy_status()
+        title = f"{self.facility.name} - Floor {floor}\n"
+        title += f"Time: {time_text} - "
+        title += f"Occupancy: {occupancy['occupied_spots']}/{occupancy['total_spots']} "
+        title += f"({occupancy['occupancy_rate']*100:.1f}%)"
+        self._title.set_text(title)
+        self._title_time = time_text
+        self.frame_version += 1
+        
+        return self.fig
+        
+    def _draw_static_view(self, floor):
+        """
+        Rebuild every artist of the facility view for a floor
+        
+        Args:
+            floor (int): Floor to visualize
+        """
+        width, height = self.facility.layout["dimensions"]
+        
         # Clear previous visualization
         self.ax.clear()
+        self._spot_labels = []
         
         # Set up the grid
         self.ax.set_xlim(-1, width)
@@ -198,39 +469,33 @@ class SmartParkingSimulator:
         self.ax.set_aspect('equal')
         self.ax.grid(True, which='both', linestyle='--', linewidth=0.5)
         
-        # Create a custom colormap for occupancy
-        cmap = LinearSegmentedColormap.from_list('occupancy', 
-                                               ['green', 'yellow', 'red'], 
-                                               N=100)
-        
-        # Draw each parking spot
-        for spot_id, spot in self.facility.spots.items():
-            if spot.floor != floor:
-                continue
-                
-            x, y = spot.location
+        # Draw all parking spots of the floor as one collection
+        self._view_idx = self.facility._floor_spot_idx.get(floor, np.empty(0, dtype=np.intp))
+        spot_xy = self.facility._spot_loc[self._view_idx]
+        spot_types = self._view_types = self.facility._spot_type_code[self._view_idx]
+        
+        # Different shape based on spot type
+        marker_paths = {}
+        marker_sizes = {}
+        for spot_type, (marker, size) in _SPOT_MARKERS.items():
+            style = MarkerStyle(marker)
+            marker_paths[spot_type] = style.get_path().transformed(style.get_transform())
+            marker_sizes[spot_type] = size
             
-            # Determine color based on status
-            if spot.occupied:
-                color = 'red'
-            elif spot.reserved:
-                color = 'yellow'
-            else:
-                color = 'green'
-                
-            # Different shape based on spot type
-            if spot.type == 'handicap':
-                marker = 's'  # square
-                size = 120
-            elif spot.type == 'electric':
-                marker = 'D'  # diamond
-                size = 100
-            else:
-                marker = 'o'  # circle
-                size = 80
-                
-            self.ax.scatter(x, y, c=color, s=size, marker=marker, edgecolors='black')
-            self.ax.text(x, y, spot_id.split('-')[1], ha='center', va='center', fontsize=8)
+        self._spot_collection = self.ax.scatter(
+            spot_xy[:, 0], spot_xy[:, 1], c=self._spot_colors(),
+            s=[marker_sizes[spot_type] for spot_type in spot_types.tolist()],
+            edgecolors='black'
+        )
+        self._spot_collection.set_paths([marker_paths[spot_type] for spot_type in spot_types.tolist()])
+        
+        # Number labels are unreadable on large layouts anyway
+        if width * height < _MAX_LABELED_AREA:
+            for i, (x, y) in zip(self._view_idx.tolist(), spot_xy.tolist()):
+                spot_id = self.facility._spot_ids[i]
+                self._spot_labels.append(
+                    self.ax.text(x, y, spot_id.split('-')[1], ha='center', va='center', fontsize=8)
+                )
             
         # Mark entrances and exits
         for entrance in self.facility.layout["entrances"]:
@@ -243,21 +508,12 @@ class SmartParkingSimulator:
             self.ax.scatter(x, y, c='purple', s=150, marker='X', edgecolors='black')
             self.ax.text(x, y+0.3, "Exit", ha='center', fontsize=10)
             
-        # Add aisles and driving paths
-        for aisle_pos in self.facility.layout["aisles"]:
-            x, y = aisle_pos
-            self.ax.add_patch(patches.Rectangle((x-0.5, y-0.5), 1, 1, 
-                                              fill=True, color='lightgray', 
-                                              alpha=0.3))
-            
-        # Add title and labels
-        occupancy = self.facility.get_occupancy_status()
-        title = f"{self.facility.name} - Floor {floor}\n"
-        title += f"Time: {self._format_time()} - "
-        title += f"Occupancy: {occupancy['occupied_spots']}/{occupancy['total_spots']} "
-        title += f"({occupancy['occupancy_rate']*100:.1f}%)"
+        # Add aisles and driving paths, as one collection
+        aisles = [patches.Rectangle((x-0.5, y-0.5), 1, 1) for x, y in self.facility.layout["aisles"]]
+        self.ax.add_collection(PatchCollection(aisles, color='lightgray', alpha=0.3), autolim=False)
         
-        self.ax.set_title(title)
+        # Add title and labels
+        self._title = self.ax.set_title(f"{self.facility.name} - Floor {floor}\n")
         self.ax.set_xlabel("X Position")
         self.ax.set_ylabel("Y Position")
         
@@ -267,18 +523,31 @@ class SmartParkingSimulator:
         self.ax.scatter([], [], c='red', s=80, marker='o', edgecolors='black', label='Occupied')
         self.ax.scatter([], [], c='green', s=120, marker='s', edgecolors='black', label='Handicap')
         self.ax.scatter([], [], c='green', s=100, marker='D', edgecolors='black', label='Electric')
-        self.ax.legend(loc='upper right')
+        self._legend = self.ax.legend(loc='upper right')
         
-        plt.tight_layout()
-        return self.fig
+        self.fig.tight_layout()
+        self._view_floor = floor
+        self.view_version += 1
+        
+    def animated_artists(self):
+        """
+        Artists that change between frames, in drawing order
+        
+        Spot markers and everything drawn on top of them are included so a
+        blitting canvas can repaint them over a cached background.
+        
+        Returns:
+            list: Matplotlib artists of the current view
+        """
+        return [self._spot_collection] + self._spot_labels + [self._legend, self._title]
+        
+    def _spot_colors(self):
+        """RGBA marker colors of the spots on the drawn floor, based on their status"""
+        occupied = self.facility._spot_occupied[self._view_idx]
+        reserved = self.facility._spot_reserved[self._view_idx]
+        status = np.maximum(2 * occupied.astype(np.int8), reserved)
+        return _SPOT_COLOR_LUT[self._view_types, status]
         
     def _format_time(self):
         """Format the current simulation time as a time of day"""
-        total_minutes = int(self.simulation_time % (24 * 60))
-        hours = total_minutes // 60
-        minutes = total_minutes % 60
-        am_pm = "AM" if hours < 12 else "PM"
-        display_hours = hours % 12
-        if display_hours == 0:
-            display_hours = 12
-        return f"{display_hours}:{minutes:02d} {am_pm}"
+        return _TIME_STRINGS[int(self.simulation_time % _MINUTES_PER_DAY)]
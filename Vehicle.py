@@ -1,19 +1,42 @@
 # This module defines the Vehicle class, which represents a vehicle in a parking system.
 #         """Get the current status of the parking spot"""
+from enum import IntEnum
+
+
+class VehicleType(IntEnum):
+    """Vehicle categories, with the same codes as the matching SpotType"""
+    STANDARD = 0
+    HANDICAP = 1
+    ELECTRIC = 2
+    
+    @classmethod
+    def coerce(cls, value):
+        """Convert a type name such as 'electric' (or a member/int) to a VehicleType"""
+        if isinstance(value, str):
+            return cls[value.upper()]
+        return cls(value)
+        
+    @property
+    def label(self):
+        """Lowercase name used in configuration and display"""
+        return self.name.lower()
+
 
 class Vehicle:
+    __slots__ = ('id', 'type', 'arrival_time', 'expected_duration', 'assigned_spot', 'preferences')
+    
     def __init__(self, vehicle_id, vehicle_type, arrival_time, expected_duration):
         """
         Initialize a vehicle
         
         Args:
             vehicle_id (str): Unique identifier for the vehicle
-            vehicle_type (str): Type of vehicle (compact, sedan, SUV, etc.)
+            vehicle_type (VehicleType or str): Type of vehicle (standard, handicap, electric)
             arrival_time (float): Time when the vehicle arrived
             expected_duration (float): Expected parking duration in minutes
         """
         self.id = vehicle_id
-        self.type = vehicle_type
+        self.type = VehicleType.coerce(vehicle_type)
         self.arrival_time = arrival_time
         self.expected_duration = expected_duration
         self.assigned_spot = None
@@ -33,4 +56,4 @@ class Vehicle:
         self.assigned_spot = spot_id
         
     def __repr__(self):
-        return f"Vehicle {self.id} ({self.type}) - Spot: {self.assigned_spot}"
+        return f"Vehicle {self.id} ({self.type.label}) - Spot: {self.assigned_spot}"
@@ -0,0 +1,179 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def bfs_csr(indptr, indices, start, target, N):
+    """
+    Breadth-first search over a CSR graph with unit edge weights
+
+    Args:
+        indptr (ndarray): CSR row pointers, length N + 1
+        indices (ndarray): CSR neighbor node IDs
+        start (int): Starting node ID
+        target (int): Node ID at which to stop early, or -1 to visit all nodes
+        N (int): Number of nodes in the graph
+
+    Returns:
+        tuple: (dist, prev) int32 arrays indexed by node ID, holding -1
+            for nodes that were not reached
+    """
+    dist = np.full(N, -1, np.int32)
+    prev = np.full(N, -1, np.int32)
+
+    # Every node is enqueued at most once, so a flat buffer is enough
+    queue = np.empty(N, np.int32)
+    head = 0
+    tail = 0
+
+    dist[start] = 0
+    queue[tail] = start
+    tail += 1
+
+    while head < tail:
+        node = queue[head]
+        head += 1
+        next_distance = dist[node] + 1
+
+        for k in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[k]
+            if dist[neighbor] >= 0:
+                continue
+            dist[neighbor] = next_distance
+            prev[neighbor] = node
+            if neighbor == target:
+                return dist, prev
+            queue[tail] = neighbor
+            tail += 1
+
+    return dist, prev
+
+
+@njit(cache=True)
+def _preference(spot_type, entrance_dist, vehicle_type, want_near_entrance):
+    """Preference score of one spot, see ParkingFacility._compute_spot_preference_score"""
+    score = 10.0  # Base score
+    if want_near_entrance and entrance_dist < 5:
+        score += 5 - entrance_dist
+
+    # Type codes match SpotType/VehicleType: 0 standard, 1 handicap, 2 electric
+    if vehicle_type == 1 and spot_type == 1:
+        score += 20
+    elif vehicle_type == 2 and spot_type == 2:
+        score += 15
+    elif spot_type == 0:
+        score += 5
+    return score
+
+
+@njit(cache=True)
+def score_spots(spot_idx, spot_type, spot_entrance_dist, vehicle_type, want_near_entrance):
+    """
+    Preference scores of the selected spots for one vehicle, in a single pass
+
+    Args:
+        spot_idx (ndarray): Creation indices of the spots to score
+        spot_type (ndarray): SpotType code of every spot
+        spot_entrance_dist (ndarray): Distance from every spot to its nearest entrance
+        vehicle_type (int): VehicleType code of the vehicle
+        want_near_entrance (bool): Whether the driver prefers spots near an entrance
+
+    Returns:
+        ndarray: Preference score of each selected spot
+    """
+    n = len(spot_idx)
+    scores = np.empty(n, np.float64)
+    for i in range(n):
+        j = spot_idx[i]
+        scores[i] = _preference(spot_type[j], spot_entrance_dist[j],
+                                vehicle_type, want_near_entrance)
+    return scores
+
+
+@njit(cache=True)
+def assignment_costs(spot_idx, spot_type, spot_entrance_dist, dist_vec,
+                     vehicle_types, want_near_entrance):
+    """
+    Hungarian cost matrix max(0.1, distance - preference / 5), in a single pass
+
+    Args:
+        spot_idx (ndarray): Creation indices of the candidate spots
+        spot_type (ndarray): SpotType code of every spot
+        spot_entrance_dist (ndarray): Distance from every spot to its nearest entrance
+        dist_vec (ndarray): Travel distance to each candidate spot
+        vehicle_types (ndarray): VehicleType code of each vehicle
+        want_near_entrance (ndarray): Near-entrance preference flag of each vehicle
+
+    Returns:
+        ndarray: float32 cost matrix of shape (vehicles, spots)
+    """
+    n_vehicles = len(vehicle_types)
+    n_spots = len(spot_idx)
+    costs = np.empty((n_vehicles, n_spots), np.float32)
+    for v in range(n_vehicles):
+        for i in range(n_spots):
+            j = spot_idx[i]
+            pref = _preference(spot_type[j], spot_entrance_dist[j],
+                               vehicle_types[v], want_near_entrance[v])
+            costs[v, i] = max(0.1, dist_vec[i] - pref / 5.0)
+    return costs
+
+
+@njit(cache=True)
+def nearest_preferred_spot(occupied, reserved, spot_type, spot_entrance_dist, spot_node,
+                           dist_map, vehicle_type, want_near_entrance, k):
+    """
+    Nearest of the k most preferred free spots, see ParkingFacility._nearest_preferred_spot
+
+    Scores every free spot and keeps the running top k in a single pass,
+    then picks the candidate with the shortest travel distance.
+
+    Args:
+        occupied (ndarray): Occupied flag of every spot
+        reserved (ndarray): Reserved flag of every spot
+        spot_type (ndarray): SpotType code of every spot
+        spot_entrance_dist (ndarray): Distance from every spot to its nearest entrance
+        spot_node (ndarray): Navigation graph node of every spot
+        dist_map (ndarray): Travel distance to every node, -1 if unreachable
+        vehicle_type (int): VehicleType code of the vehicle
+        want_near_entrance (bool): Whether the driver prefers spots near an entrance
+        k (int): Number of preferred spots to consider
+
+    Returns:
+        int: Creation index of the chosen spot, or -1 if none is free and reachable
+    """
+    top_idx = np.empty(k, np.int64)
+    top_score = np.empty(k, np.float64)
+    n_top = 0
+
+    for j in range(len(occupied)):
+        if occupied[j] or reserved[j]:
+            continue
+        score = _preference(spot_type[j], spot_entrance_dist[j],
+                            vehicle_type, want_near_entrance)
+
+        # Spots are visited in creation order, so ties keep the earlier spot
+        if n_top == k and score <= top_score[k - 1]:
+            continue
+        pos = min(n_top, k - 1)
+        while pos > 0 and top_score[pos - 1] < score:
+            top_score[pos] = top_score[pos - 1]
+            top_idx[pos] = top_idx[pos - 1]
+            pos -= 1
+        top_score[pos] = score
+        top_idx[pos] = j
+        if n_top < k:
+            n_top += 1
+
+    # A lone candidate wins without consulting distances
+    if n_top == 1:
+        return top_idx[0]
+
+    best = -1
+    shortest_distance = np.inf
+    for i in range(n_top):
+        distance = dist_map[spot_node[top_idx[i]]]
+        if 0 <= distance < shortest_distance:
+            shortest_distance = distance
+            best = top_idx[i]
+    return best